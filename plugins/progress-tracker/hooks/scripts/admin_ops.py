@@ -55,9 +55,11 @@ def reset_tracking(
     if not progress_dir.exists() or not any(path.exists() for path in tracked_files):
         orphan_removed = []
         for path in summary_files:
-            if path.exists():
+            try:
                 path.unlink()
-                orphan_removed.append(path.name)
+            except FileNotFoundError:
+                continue
+            orphan_removed.append(path.name)
         if orphan_removed:
             print(
                 "No active progress tracking found. "
@@ -101,10 +103,13 @@ def reset_tracking(
         archived_entry = archive_current_progress("reset")
         record_reset_event()
 
-        # 3. Clear active tracking and summary files.
+        # 3. Clear active tracking and summary files (known paths only; a
+        #    missing file is skipped by the unlink itself, not a prior stat).
         for path in tracked_files + summary_files:
-            if path.exists():
+            try:
                 path.unlink()
+            except FileNotFoundError:
+                pass
 
         if remove_active:
             print("Progress tracking completely removed.")
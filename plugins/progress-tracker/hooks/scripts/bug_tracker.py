@@ -4,11 +4,43 @@ from __future__ import annotations
 import json
 import logging
 import re
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger("progress_tracker.bug_tracker")
 
+# Control characters stripped from bug descriptions (newline/tab/CR are kept).
+CONTROL_CHARS_PATTERN = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+BUG_STATUSES = (
+    "pending_investigation",
+    "investigating",
+    "confirmed",
+    "fixing",
+    "fixed",
+    "false_positive",
+)
+BUG_PRIORITIES = ("high", "medium", "low")
+BUG_CATEGORIES = ("bug", "technical_debt")
+
+# list_bugs ordering: workflow status first, then priority
+_BUG_STATUS_RANK = {status: rank for rank, status in enumerate(BUG_STATUSES)}
+_BUG_PRIORITY_RANK = {priority: rank for rank, priority in enumerate(BUG_PRIORITIES)}
+_BUG_STATUS_ICONS = {
+    "pending_investigation": "🔴",
+    "investigating": "🟡",
+    "confirmed": "🟢",
+    "fixing": "🔧",
+    "fixed": "✅",
+    "false_positive": "❌"
+}
+
+
+def _iso_now() -> str:
+    """Return current UTC timestamp in ISO 8601 format with Z suffix."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
 
 def list_bugs(
     *,
@@ -27,30 +59,16 @@ def list_bugs(
 
     print(f"\n## Bug Backlog ({len(bugs)} total)\n")
 
-    # Group by status
-    status_icons = {
-        "pending_investigation": "🔴",
-        "investigating": "🟡",
-        "confirmed": "🟢",
-        "fixing": "🔧",
-        "fixed": "✅",
-        "false_positive": "❌"
-    }
-
     # Sort by priority and status
-    priority_order = {"high": 0, "medium": 1, "low": 2}
-    status_order = ["pending_investigation", "investigating", "confirmed", "fixing", "fixed", "false_positive"]
-
     def sort_key(bug):
-        priority = bug.get("priority", "medium")
-        status = bug.get("status", "pending_investigation")
         return (
-            status_order.index(status) if status in status_order else 99,
-            priority_order.get(priority, 1),
+            _BUG_STATUS_RANK.get(bug.get("status", "pending_investigation"), 99),
+            _BUG_PRIORITY_RANK.get(bug.get("priority", "medium"), 1),
             bug.get("created_at", "")
         )
 
     sorted_bugs = sorted(bugs, key=sort_key)
+    now_utc = datetime.now(timezone.utc)
 
     for bug in sorted_bugs:
         bug_id = bug.get("id", "Unknown")
@@ -61,18 +79,19 @@ def list_bugs(
         created_at = bug.get("created_at", "")
         scheduled = bug.get("scheduled_position", {})
 
-        icon = status_icons.get(status, "❓")
+        icon = _BUG_STATUS_ICONS.get(status, "❓")
 
         # Calculate time ago
         time_ago = ""
         if created_at:
             try:
                 created_dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                now = datetime.now(created_dt.tzinfo)
-                diff = now - created_dt
-                hours = diff.total_seconds() / 3600
+                if created_dt.tzinfo is None:
+                    created_dt = created_dt.astimezone()
+                seconds = (now_utc - created_dt).total_seconds()
+                hours = seconds / 3600
                 if hours < 1:
-                    time_ago = f"{int(diff.total_seconds() / 60)}m ago"
+                    time_ago = f"{int(seconds / 60)}m ago"
                 elif hours < 24:
                     time_ago = f"{int(hours)}h ago"
                 else:
@@ -121,7 +140,7 @@ def _add_bug_internal(
     *,
     load_progress_json_fn: Callable[[], Optional[Dict[str, Any]]],
     save_progress_json_fn: Callable[[Dict[str, Any]], None],
-    get_next_bug_id_fn: Callable[[], str],
+    get_next_bug_id_fn: Callable[[Dict[str, Any]], str],
     generate_progress_md_fn: Callable[[Dict[str, Any]], str],
     save_progress_md_fn: Callable[[str], None],
 ) -> Tuple[bool, Optional[str]]:
@@ -136,22 +155,18 @@ def _add_bug_internal(
         raise ValueError(f"Description too long ({len(description)} chars, max 2000)")
 
     # Validate status
-    valid_statuses = ["pending_investigation", "investigating", "confirmed",
-                     "fixing", "fixed", "false_positive"]
-    if status not in valid_statuses:
-        raise ValueError(f"Invalid status '{status}'. Must be one of: {valid_statuses}")
+    if status not in BUG_STATUSES:
+        raise ValueError(f"Invalid status '{status}'. Must be one of: {list(BUG_STATUSES)}")
 
     # Validate priority
-    valid_priorities = ["high", "medium", "low"]
-    if priority not in valid_priorities:
-        raise ValueError(f"Invalid priority '{priority}'. Must be one of: {valid_priorities}")
+    if priority not in BUG_PRIORITIES:
+        raise ValueError(f"Invalid priority '{priority}'. Must be one of: {list(BUG_PRIORITIES)}")
 
-    valid_categories = ["bug", "technical_debt"]
-    if category not in valid_categories:
-        raise ValueError(f"Invalid category '{category}'. Must be one of: {valid_categories}")
+    if category not in BUG_CATEGORIES:
+        raise ValueError(f"Invalid category '{category}'. Must be one of: {list(BUG_CATEGORIES)}")
 
     # Sanitize description (remove control characters except newline/tab)
-    description = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]', '', description)
+    description = CONTROL_CHARS_PATTERN.sub('', description)
 
     data = load_progress_json_fn()
     if not data:
@@ -163,19 +178,19 @@ def _add_bug_internal(
         data["bugs"] = bugs
 
     # Check for duplicate bugs (case-insensitive, normalized whitespace)
-    normalized_desc = re.sub(r'\s+', ' ', description.lower())
+    normalized_desc = WHITESPACE_PATTERN.sub(' ', description.lower())
     for bug in bugs:
         if bug.get("status") == "false_positive":
             continue
         bug_desc = bug.get("description", "")
-        normalized_bug_desc = re.sub(r'\s+', ' ', bug_desc.lower())
+        normalized_bug_desc = WHITESPACE_PATTERN.sub(' ', bug_desc.lower())
         if normalized_bug_desc == normalized_desc:
             print(f"Duplicate bug detected: {bug.get('id')}")
             print("Use 'update-bug' to add more information or different bug.")
             return False, None
 
     # Generate new bug ID
-    bug_id = get_next_bug_id_fn()
+    bug_id = get_next_bug_id_fn(data)
 
     # Parse scheduled position
     scheduled_pos = None
@@ -207,18 +222,17 @@ def _add_bug_internal(
             if not isinstance(quick_verification, dict):
                 raise ValueError("Verification results must be a JSON object")
 
-            # Limit nesting depth to prevent stack overflow
-            def check_depth(obj, current_depth=0, max_depth=10):
-                if current_depth > max_depth:
+            # Limit nesting depth (iterative walk, no recursion)
+            max_depth = 10
+            stack = [(quick_verification, 0)]
+            while stack:
+                obj, depth = stack.pop()
+                if depth > max_depth:
                     raise ValueError("JSON nesting too deep (max 10 levels)")
                 if isinstance(obj, dict):
-                    for v in obj.values():
-                        check_depth(v, current_depth + 1, max_depth)
+                    stack.extend((v, depth + 1) for v in obj.values())
                 elif isinstance(obj, list):
-                    for v in obj:
-                        check_depth(v, current_depth + 1, max_depth)
-
-            check_depth(quick_verification)
+                    stack.extend((v, depth + 1) for v in obj)
 
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid verification results JSON: {e}")
@@ -229,7 +243,7 @@ def _add_bug_internal(
         "status": status,
         "priority": priority,
         "category": category,
-        "created_at": datetime.now().isoformat() + "Z",
+        "created_at": _iso_now(),
         "quick_verification": quick_verification,
     }
 
@@ -305,10 +319,11 @@ def update_bug(
         return False
 
     updated = False
+    now_iso = _iso_now()
 
     if status:
         bug["status"] = status
-        bug["updated_at"] = datetime.now().isoformat() + "Z"
+        bug["updated_at"] = now_iso
         updated = True
 
         # Set current bug if starting investigation/fixing
@@ -322,12 +337,12 @@ def update_bug(
         if "investigation" not in bug:
             bug["investigation"] = {}
         bug["investigation"]["root_cause"] = root_cause
-        bug["investigation"]["confirmed_at"] = datetime.now().isoformat() + "Z"
+        bug["investigation"]["confirmed_at"] = now_iso
         updated = True
 
     if fix_summary:
         bug["fix_summary"] = fix_summary
-        bug["fixed_at"] = datetime.now().isoformat() + "Z"
+        bug["fixed_at"] = now_iso
         updated = True
 
     if updated:
@@ -15,7 +15,7 @@ import subprocess
 import sys
 import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
@@ -116,8 +116,8 @@ class AcceptanceTestResult:
 # ---------------------------------------------------------------------------
 
 def _iso_now() -> str:
-    """Return current local timestamp with trailing Z for compatibility."""
-    return datetime.now().isoformat() + "Z"
+    """Return current UTC timestamp in ISO 8601 format with Z suffix."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
 def _parse_iso_timestamp(value: Optional[str]) -> Optional[datetime]:
@@ -273,19 +273,8 @@ def _is_project_fully_completed(data: Dict[str, Any]) -> bool:
 # Functions with services injection
 # ---------------------------------------------------------------------------
 
-def complete_feature_ai_metrics(feature_id: int, services: CompletionFlowServices) -> bool:
-    """Mark AI metrics completion timestamp and duration for a feature."""
-    data = services.load_progress_json_fn()
-    if not data:
-        print("No progress tracking found")
-        return False
-
-    features = data.get("features", [])
-    feature = next((f for f in features if f.get("id") == feature_id), None)
-    if not feature:
-        print(f"Feature ID {feature_id} not found")
-        return False
-
+def _finalize_ai_metrics(feature: Dict[str, Any]) -> int:
+    """Stamp ai_metrics finished_at/duration on *feature* in place; return duration."""
     now = datetime.now().astimezone()
     now_iso = now.isoformat().replace("+00:00", "Z")
 
@@ -303,6 +292,23 @@ def complete_feature_ai_metrics(feature_id: int, services: CompletionFlowService
     ai_metrics["finished_at"] = now_iso
     ai_metrics["duration_seconds"] = duration_seconds
     feature["ai_metrics"] = ai_metrics
+    return duration_seconds
+
+
+def complete_feature_ai_metrics(feature_id: int, services: CompletionFlowServices) -> bool:
+    """Mark AI metrics completion timestamp and duration for a feature."""
+    data = services.load_progress_json_fn()
+    if not data:
+        print("No progress tracking found")
+        return False
+
+    features = data.get("features", [])
+    feature = next((f for f in features if f.get("id") == feature_id), None)
+    if not feature:
+        print(f"Feature ID {feature_id} not found")
+        return False
+
+    duration_seconds = _finalize_ai_metrics(feature)
 
     services.save_progress_json_fn(data)
 
@@ -312,16 +318,23 @@ def complete_feature_ai_metrics(feature_id: int, services: CompletionFlowService
     return True
 
 
-def save_archive_record(feature_id: int, archive_result: Dict[str, Any], services: CompletionFlowServices) -> None:
+def save_archive_record(
+    feature_id: int,
+    archive_result: Dict[str, Any],
+    services: CompletionFlowServices,
+    data: Optional[Dict[str, Any]] = None,
+) -> None:
     """
     Save archive record to progress.json for traceability.
 
     Args:
         feature_id: The ID of the completed feature
         archive_result: The result dict from archive_feature_docs()
+        data: Progress payload the caller already loaded; reloaded when omitted
     """
     try:
-        data = services.load_progress_json_fn()
+        if data is None:
+            data = services.load_progress_json_fn()
         if not data:
             logger.warning("Could not save archive record - no progress data found")
             return
@@ -335,7 +348,7 @@ def save_archive_record(feature_id: int, archive_result: Dict[str, Any], service
 
         # Store archive info
         feature["archive_info"] = {
-            "archived_at": datetime.now().isoformat() + "Z",
+            "archived_at": _iso_now(),
             "files_moved": len(archive_result.get("archived_files", [])),
             "files": archive_result.get("archived_files", [])
         }
@@ -641,19 +654,9 @@ def _finalize_completion_state_in_memory(
     if feature.get("completed"):
         return data, False
 
-    ai_metrics = feature.get("ai_metrics", {})
-    if not isinstance(ai_metrics, dict):
-        ai_metrics = {}
-    if not ai_metrics.get("finished_at"):
-        now = datetime.now().astimezone()
-        now_iso = now.isoformat().replace("+00:00", "Z")
-        started_at = _parse_iso_timestamp(ai_metrics.get("started_at"))
-        if not started_at:
-            started_at = now
-            ai_metrics["started_at"] = now_iso
-        ai_metrics["finished_at"] = now_iso
-        ai_metrics["duration_seconds"] = int(max(0, (now - started_at).total_seconds()))
-    feature["ai_metrics"] = ai_metrics
+    ai_metrics = feature.get("ai_metrics")
+    if not isinstance(ai_metrics, dict) or not ai_metrics.get("finished_at"):
+        _finalize_ai_metrics(feature)
 
     feature["completed"] = True
     feature["development_stage"] = "completed"
@@ -1146,7 +1149,7 @@ def cmd_done(services: CompletionFlowServices, commit_hash=None, run_all: bool =
                 print("Warning: Some files could not be archived (feature still marked complete)")
             data_post_archive = services.load_progress_json_fn()
             if data_post_archive:
-                save_archive_record(feature_id, archive_result, services)
+                save_archive_record(feature_id, archive_result, services, data=data_post_archive)
         except Exception as exc:
             logger.error(f"Archive failed but feature completed: {exc}")
             print("Warning: Document archiving failed but feature is marked complete")
@@ -1259,10 +1262,9 @@ def complete_feature(feature_id, services: CompletionFlowServices, commit_hash=N
             if archive_result["archived_files"]:
                 print(f"Archived {len(archive_result['archived_files'])} file(s)")
 
-            # Save archive record regardless of individual file errors.
-            refreshed = services.load_progress_json_fn()
-            if refreshed:
-                save_archive_record(feature_id, archive_result, services)
+            # Save archive record regardless of individual file errors. `data`
+            # matches what was just saved (archiving does not write progress.json).
+            save_archive_record(feature_id, archive_result, services, data=data)
 
             if archive_result["errors"]:
                 print(f"Warning: Some files could not be archived (feature still marked complete)")
@@ -1289,6 +1291,8 @@ def complete_feature(feature_id, services: CompletionFlowServices, commit_hash=N
                 logger.error(f"Completed-run archive failed: {e}")
                 print(f"Warning: Completed-run archive failed, but active state will still be cleared.")
 
+    # Capability memory lives outside progress.json, so one reload serves
+    # both the memory append and the reset check below.
     refreshed = services.load_progress_json_fn()
     if refreshed:
         feat_for_memory = next((f for f in refreshed.get("features", []) if f.get("id") == feature_id), None)
@@ -1296,7 +1300,6 @@ def complete_feature(feature_id, services: CompletionFlowServices, commit_hash=N
             _append_capability_memory(feat_for_memory, resolved_commit, services)
 
     # ── Outside if not skip_archive — always runs ──
-    refreshed = services.load_progress_json_fn()
     if refreshed and _is_project_fully_completed(refreshed):
         if services.reset_active_progress_fn:
             services.reset_active_progress_fn(refreshed)
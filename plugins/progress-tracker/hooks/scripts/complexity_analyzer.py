@@ -10,7 +10,7 @@ Features:
 - Complexity assessment based on multiple metrics
 - Disk-based caching with TTL
 - Cache invalidation on project changes
-- JSON serialization for easy inspection
+- Compact JSON serialization (pretty-print on demand with --dump-cache)
 """
 
 import warnings
@@ -50,6 +50,9 @@ class ComplexityAnalyzer:
     COMPLEX_MIN_FILES = 5
     COMPLEX_MIN_STEPS = 5
 
+    # Terms counted (once per step) as technical-depth signals
+    STEP_TECHNICAL_TERMS = ('api', 'database', 'sql', 'http', 'json', 'auth')
+
     def __init__(self, cache_dir: Optional[Path] = None, project_root: Optional[Path] = None):
         """
         Initialize the complexity analyzer.
@@ -69,7 +72,8 @@ class ComplexityAnalyzer:
             self.cache_dir = Path(cache_dir)
             self.cache_file = self.cache_dir / "complexity_cache.json"
 
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Created lazily on first write so read-only analyzers stay I/O free.
+        self._cache_dir_ready = False
 
     def _get_cache_key(self, feature_description: str, test_steps: List[str]) -> str:
         """
@@ -117,8 +121,12 @@ class ComplexityAnalyzer:
     def _save_cache(self, cache: Dict) -> None:
         """Save the cache to disk."""
         try:
+            if not self._cache_dir_ready:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                self._cache_dir_ready = True
+            payload = json.dumps(cache, separators=(',', ':'))
             with open(self.cache_file, 'w') as f:
-                json.dump(cache, f, indent=2)
+                f.write(payload)
         except IOError:
             # Fail silently - caching is optional
             pass
@@ -151,16 +159,15 @@ class ComplexityAnalyzer:
         design_score = sum(1 for kw in design_keywords if kw in desc_lower)
         complex_score = sum(1 for kw in complex_keywords if kw in desc_lower)
 
-        # Analyze test steps
+        # Analyze test steps: word counts and technical terms in one pass
         num_steps = len(test_steps)
-        avg_step_length = sum(len(step.split()) for step in test_steps) / max(num_steps, 1)
-
-        # Count technical terms in test steps
+        total_step_words = 0
         technical_terms = 0
         for step in test_steps:
+            total_step_words += len(step.split())
             step_lower = step.lower()
-            technical_terms += sum(1 for term in ['api', 'database', 'sql', 'http', 'json', 'auth']
-                                   if term in step_lower)
+            technical_terms += sum(1 for term in self.STEP_TECHNICAL_TERMS if term in step_lower)
+        avg_step_length = total_step_words / max(num_steps, 1)
 
         # Estimate file changes from description
         file_indicators = [
@@ -385,8 +392,13 @@ if __name__ == "__main__":
     # Simple CLI for testing
     import sys
 
+    if len(sys.argv) == 2 and sys.argv[1] == "--dump-cache":
+        print(json.dumps(ComplexityAnalyzer()._load_cache(), indent=2))
+        sys.exit(0)
+
     if len(sys.argv) < 3:
         print("Usage: python complexity_analyzer.py '<description>' '<step1>' '<step2>' ...")
+        print("       python complexity_analyzer.py --dump-cache")
         sys.exit(1)
 
     description = sys.argv[1]
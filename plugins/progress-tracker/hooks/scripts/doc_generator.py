@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import fnmatch
 import logging
+import os
 import re
 import shutil
 from datetime import datetime, timezone
@@ -46,6 +48,32 @@ def _slugify(text: Optional[str], fallback: str = "project") -> str:
     return slug[:48] if slug else fallback
 
 
+# Plan structure headings checked by validate_plan_document().
+# Match both "## Tasks" (list style) and "## Task 1: name" (Superpowers individual tasks).
+PLAN_TASKS_PATTERN = re.compile(r"^##+\s+Tasks?\b", re.IGNORECASE | re.MULTILINE)
+PLAN_ACCEPTANCE_PATTERN = re.compile(
+    r"^##+\s+Acceptance(\s+Criteria)?(\s+Mapping)?\b", re.IGNORECASE | re.MULTILINE
+)
+PLAN_RISKS_PATTERN = re.compile(r"^##+\s+Risks?\b", re.IGNORECASE | re.MULTILINE)
+# Accept English and Chinese field labels (writing-plans generates Chinese when prompted in Chinese).
+PLAN_GOAL_PATTERN = re.compile(r"^\*\*(Goal|目标):\*\*\s+.+", re.MULTILINE)
+PLAN_ARCHITECTURE_PATTERN = re.compile(r"^\*\*(Architecture|架构):\*\*\s+.+", re.MULTILINE)
+PLAN_STRICT_SECTIONS = {
+    "tasks": PLAN_TASKS_PATTERN,
+    "acceptance_mapping": PLAN_ACCEPTANCE_PATTERN,
+    "risks": PLAN_RISKS_PATTERN,
+}
+PLAN_SUPERPOWERS_FIELDS = {
+    "goal": PLAN_GOAL_PATTERN,
+    "architecture": PLAN_ARCHITECTURE_PATTERN,
+}
+# Plan files are scanned in chunks of whole lines. The partial last line is
+# carried into the next read so a heading split at the boundary is never
+# searched half-finished (the trailing "\b" would match at buffer end), and
+# the last complete line is carried too because "\s+" may span a newline
+# (e.g. "**Goal:**\n<value>").
+PLAN_SCAN_CHUNK_CHARS = 8192
+
 PLAN_PATH_PREFIX = "docs/plans/"
 SUPERPOWERS_PLAN_PATH_PREFIX = "docs/superpowers/plans/"
 VALID_PLAN_PREFIXES = (PLAN_PATH_PREFIX, SUPERPOWERS_PLAN_PATH_PREFIX)
@@ -133,6 +161,33 @@ def validate_plan_path(
     return {"valid": True, "normalized_path": normalized, "error": None}
 
 
+def _scan_plan_sections(path: Path) -> Dict[str, bool]:
+    """
+    Report which plan headings/fields exist, reading the file in chunks.
+
+    Stops as soon as every strict section is found, since the Superpowers
+    header fields only matter when a strict section is missing.
+    """
+    found = {name: False for name in (*PLAN_STRICT_SECTIONS, *PLAN_SUPERPOWERS_FIELDS)}
+    patterns = {**PLAN_STRICT_SECTIONS, **PLAN_SUPERPOWERS_FIELDS}
+    carry = ""
+    with path.open("r", encoding="utf-8") as handle:
+        while True:
+            chunk = handle.read(PLAN_SCAN_CHUNK_CHARS)
+            buffer = carry + chunk
+            if chunk:
+                # Search complete lines only, and search the last one again
+                # with the next read in case a match continues past it.
+                end = buffer.rfind("\n") + 1
+                start = buffer.rfind("\n", 0, end - 1) + 1 if end else 0
+                buffer, carry = buffer[:end], buffer[start:]
+            for name, pattern in patterns.items():
+                if not found[name] and pattern.search(buffer):
+                    found[name] = True
+            if not chunk or all(found[name] for name in PLAN_STRICT_SECTIONS):
+                return found
+
+
 def validate_plan_document(
     plan_path: str,
     target_root: Optional[Path] = None,
@@ -176,7 +231,7 @@ def validate_plan_document(
     base_root = target_root or (find_project_root_fn() if find_project_root_fn else prog_paths.find_project_root())
     absolute_path = base_root / path_validation["normalized_path"]
     try:
-        content = absolute_path.read_text(encoding="utf-8")
+        found = _scan_plan_sections(absolute_path)
     except OSError as exc:
         return {
             "valid": False,
@@ -186,21 +241,8 @@ def validate_plan_document(
             "profile": "invalid",
         }
 
-    checks = {
-        # Match both "## Tasks" (list style) and "## Task 1: name" (Superpowers individual tasks)
-        "tasks": re.search(r"^##+\s+Tasks?\b", content, flags=re.IGNORECASE | re.MULTILINE),
-        "acceptance_mapping": re.search(
-            r"^##+\s+Acceptance(\s+Criteria)?(\s+Mapping)?\b",
-            content,
-            flags=re.IGNORECASE | re.MULTILINE,
-        ),
-        "risks": re.search(r"^##+\s+Risks?\b", content, flags=re.IGNORECASE | re.MULTILINE),
-    }
-    superpowers_checks = {
-        # Accept English and Chinese field labels (writing-plans generates Chinese when prompted in Chinese)
-        "goal": re.search(r"^\*\*(Goal|目标):\*\*\s+.+", content, flags=re.MULTILINE),
-        "architecture": re.search(r"^\*\*(Architecture|架构):\*\*\s+.+", content, flags=re.MULTILINE),
-    }
+    checks = {name: found[name] for name in PLAN_STRICT_SECTIONS}
+    superpowers_checks = {name: found[name] for name in PLAN_SUPERPOWERS_FIELDS}
 
     missing_sections = [name for name, found in checks.items() if not found]
 
@@ -482,9 +524,16 @@ def archive_feature_docs(
         plans_archive = project_root / "docs" / "archive" / "plans"
         testing_archive = project_root / "docs" / "archive" / "testing"
 
-        # Create archive directories if they don't exist
-        testing_archive.mkdir(parents=True, exist_ok=True)
-        plans_archive.mkdir(parents=True, exist_ok=True)
+        # Archive directories are created on first move into them
+        ready_archive_dirs: Set[Path] = set()
+
+        def _ensure_archive_dir(archive_dir: Path) -> None:
+            if archive_dir not in ready_archive_dirs:
+                archive_dir.mkdir(parents=True, exist_ok=True)
+                ready_archive_dirs.add(archive_dir)
+
+        # One suffix per archive run for any filename conflicts
+        conflict_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         # Try to get plan_path from feature object (preserved before workflow_state clear)
         data = load_progress_json_fn()
@@ -504,22 +553,21 @@ def archive_feature_docs(
                         )
                         result["skipped_files"].append(f"Protected: {plan_path_from_feature}")
                     else:
+                        _ensure_archive_dir(plans_archive)
                         dst_file = plans_archive / plan_file.name
 
                         # Handle filename conflicts
                         if dst_file.exists():
-                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                            stem = plan_file.stem
-                            suffix = plan_file.suffix
-                            new_name = f"{stem}_{timestamp}{suffix}"
+                            new_name = f"{plan_file.stem}_{conflict_timestamp}{plan_file.suffix}"
                             dst_file = plans_archive / new_name
 
                         shutil.move(str(plan_file), str(dst_file))
+                        dst_rel = str(dst_file.relative_to(project_root))
                         result["archived_files"].append({
                             "from": plan_path_from_feature,
-                            "to": str(dst_file.relative_to(project_root))
+                            "to": dst_rel
                         })
-                        logger.info(f"Archived plan: {plan_path_from_feature} -> {dst_file.relative_to(project_root)}")
+                        logger.info(f"Archived plan: {plan_path_from_feature} -> {dst_rel}")
             except Exception as e:
                 error_msg = f"Failed to archive plan {plan_path_from_feature}: {e}"
                 result["errors"].append(error_msg)
@@ -534,13 +582,22 @@ def archive_feature_docs(
             (testing_src, testing_archive, f"bug-*-fix-report.md"),
         ]
 
+        # List each source directory once; testing/ serves two patterns
+        dir_listings: Dict[Path, Optional[List[Path]]] = {}
         for src_dir, dst_dir, pattern in patterns:
-            if not src_dir.exists():
+            if src_dir not in dir_listings:
+                try:
+                    with os.scandir(src_dir) as entries:
+                        dir_listings[src_dir] = [Path(entry.path) for entry in entries]
+                except OSError:
+                    dir_listings[src_dir] = None
+            listing = dir_listings[src_dir]
+            if listing is None:
                 result["skipped_files"].append(f"Source directory not found: {src_dir}")
                 continue
 
             # Find matching files
-            matching_files = list(src_dir.glob(pattern))
+            matching_files = [path for path in listing if fnmatch.fnmatchcase(path.name, pattern)]
 
             if not matching_files:
                 # Debug log but don't report to user (too verbose)
@@ -558,23 +615,23 @@ def archive_feature_docs(
                     result["skipped_files"].append(f"Protected: {src_file.name}")
                     continue
                 try:
+                    _ensure_archive_dir(dst_dir)
                     dst_file = dst_dir / src_file.name
 
                     # Handle filename conflicts by adding timestamp
                     if dst_file.exists():
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        stem = src_file.stem
-                        suffix = src_file.suffix
-                        new_name = f"{stem}_{timestamp}{suffix}"
+                        new_name = f"{src_file.stem}_{conflict_timestamp}{src_file.suffix}"
                         dst_file = dst_dir / new_name
 
-                    # Move the file
+                    # Move the file (shutil.move renames in place on the same filesystem)
+                    src_rel = str(src_file.relative_to(project_root))
                     shutil.move(str(src_file), str(dst_file))
+                    dst_rel = str(dst_file.relative_to(project_root))
                     result["archived_files"].append({
-                        "from": str(src_file.relative_to(project_root)),
-                        "to": str(dst_file.relative_to(project_root))
+                        "from": src_rel,
+                        "to": dst_rel
                     })
-                    logger.info(f"Archived: {src_file.name} -> {dst_file.relative_to(project_root)}")
+                    logger.info(f"Archived: {src_file.name} -> {dst_rel}")
 
                 except Exception as e:
                     error_msg = f"Failed to move {src_file.name}: {e}"
@@ -35,7 +35,7 @@ DEVELOPMENT_STAGES = ("planning", "developing", "completed")
 
 
 def _iso_now() -> str:
-    return datetime.datetime.utcnow().isoformat()
+    return datetime.datetime.now(datetime.timezone.utc).isoformat().replace("+00:00", "Z")
 
 
 @dataclass
@@ -28,13 +28,12 @@ def plugin_root() -> Path:
 def extract_source_block(source_text: str, name: str) -> str:
     start = SOURCE_BLOCK_START.format(name=name)
     end = SOURCE_BLOCK_END.format(name=name)
-    if start not in source_text or end not in source_text:
+    _, found_start, rest = source_text.partition(start)
+    block, found_end, _ = rest.partition(end)
+    if not found_start or not found_end:
         raise ValueError(f"Missing source block markers for {name}")
 
-    start_idx = source_text.index(start) + len(start)
-    end_idx = source_text.index(end)
-    block = source_text[start_idx:end_idx].strip("\n")
-    return block + "\n"
+    return block.strip("\n") + "\n"
 
 
 def render_generated_block(block_text: str) -> str:
@@ -62,6 +61,25 @@ def render_prog_help(block_text: str) -> str:
     )
 
 
+def target_differs(path: Path, expected: str) -> bool:
+    """Return True when ``path`` does not already contain ``expected``.
+
+    Newlines are normalized like ``read_text`` would, so a CRLF checkout is
+    not reported as drift. Normalizing only shrinks a file, so one shorter
+    than ``expected`` is known to differ from a single stat.
+    """
+    expected_bytes = expected.encode("utf-8")
+    try:
+        if path.stat().st_size < len(expected_bytes):
+            return True
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return True
+    if raw == expected_bytes:
+        return False
+    return raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n") != expected_bytes
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Generate PROG command docs")
     mode = parser.add_mutually_exclusive_group(required=True)
@@ -82,32 +100,34 @@ def main() -> int:
     source_zh = extract_source_block(source_text, "README_ZH")
     source_help = extract_source_block(source_text, "PROG_HELP")
 
+    # README targets embed the generated block in hand-written content, so
+    # they must be read to build the expected text. PROG_HELP.md is fully
+    # generated and can be compared without reading it in the common case.
     readme_en_current = readme_en_path.read_text(encoding="utf-8")
     readme_zh_current = readme_zh_path.read_text(encoding="utf-8")
-    help_current = help_path.read_text(encoding="utf-8") if help_path.exists() else ""
 
     readme_en_expected = replace_generated_block(readme_en_current, source_en, readme_en_path.name)
     readme_zh_expected = replace_generated_block(readme_zh_current, source_zh, readme_zh_path.name)
     help_expected = render_prog_help(source_help)
 
-    changes: list[tuple[Path, str, str]] = []
+    changes: list[tuple[Path, str]] = []
     if readme_en_current != readme_en_expected:
-        changes.append((readme_en_path, readme_en_current, readme_en_expected))
+        changes.append((readme_en_path, readme_en_expected))
     if readme_zh_current != readme_zh_expected:
-        changes.append((readme_zh_path, readme_zh_current, readme_zh_expected))
-    if help_current != help_expected:
-        changes.append((help_path, help_current, help_expected))
+        changes.append((readme_zh_path, readme_zh_expected))
+    if target_differs(help_path, help_expected):
+        changes.append((help_path, help_expected))
 
     if args.check:
         if changes:
             print("Generated docs are out of date:")
-            for path, _, _ in changes:
+            for path, _ in changes:
                 print(f"- {path}")
             return 1
         print("Generated docs are up to date.")
         return 0
 
-    for path, _, expected in changes:
+    for path, expected in changes:
         path.write_text(expected, encoding="utf-8")
         print(f"Updated {path}")
 
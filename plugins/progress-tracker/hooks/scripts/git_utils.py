@@ -3,20 +3,25 @@ git_utils.py — Git and worktree operational helpers.
 
 Extracted from progress_manager.py (F18 modularisation).
 """
+import json
 import os
-import re
 import subprocess
 import logging
+import time
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from prog_paths import (
+    _GIT_DISCOVERY_ENV,
+    _find_dotgit,
     resolve_repo_root as _resolve_repo_root,
     get_state_dir,
+    get_tracker_docs_root,
 )
 from state_io import (
     load_progress_json,
+    _atomic_write_text,
     _normalize_optional_string,
     compare_contexts,
     _normalize_context_path,
@@ -44,6 +49,12 @@ STATE_FILE_NAMES = [
     "project_memory.json",
 ]
 
+# Back-to-back hook runs (e.g. a quick session restart) reuse the last
+# git-sync-check report instead of re-probing git. The report lives in the
+# git dir so it can never show up as an untracked file in the work tree.
+GIT_SYNC_CACHE_TTL_SECONDS = 5.0
+GIT_SYNC_CACHE_FILENAME = "progress-tracker-git-sync.json"
+
 STATE_DIR_NAMES = [
     "test_reports",
     "progress_archive",
@@ -65,23 +76,24 @@ RUNTIME_CONTEXT_COMPARE_KEYS = (
 )
 
 # ---------------------------------------------------------------------------
-# Git Validator Import Fallback
+# Git Validator (lazy import)
 # ---------------------------------------------------------------------------
 
-try:
-    from git_validator import (
-        safe_git_command,
-        validate_commit_hash,
-        GitCommandError,
-        is_git_repository,
-        get_git_root,
-        is_working_directory_clean,
-        get_current_commit_hash,
-    )
-    GIT_VALIDATOR_AVAILABLE = True
-except ImportError:
-    GIT_VALIDATOR_AVAILABLE = False
-    GitCommandError = subprocess.CalledProcessError
+# git_validator is imported on first git call so subcommands that never touch
+# git skip it. None = not attempted yet, False = unavailable.
+_GIT_VALIDATOR: Any = None
+
+
+def _git_validator() -> Any:
+    """Return the git_validator module, or None when it cannot be imported."""
+    global _GIT_VALIDATOR
+    if _GIT_VALIDATOR is None:
+        try:
+            import git_validator
+        except ImportError:
+            git_validator = False
+        _GIT_VALIDATOR = git_validator
+    return _GIT_VALIDATOR or None
 
 
 # ---------------------------------------------------------------------------
@@ -97,8 +109,9 @@ def _run_git(args: List[str], cwd: Optional[str] = None, timeout: int = 5) -> Tu
         if getattr(pm_func, "is_wrapper", None) is not True:
             return pm_func(args, cwd=cwd, timeout=timeout)
 
-    if GIT_VALIDATOR_AVAILABLE:
-        return safe_git_command(["git"] + args, cwd=cwd, timeout=timeout)
+    validator = _git_validator()
+    if validator is not None:
+        return validator.safe_git_command(["git"] + args, cwd=cwd, timeout=timeout)
 
     try:
         result = subprocess.run(
@@ -569,29 +582,60 @@ def _format_context_summary(context: Optional[Dict[str, Any]]) -> str:
 # ---------------------------------------------------------------------------
 
 def _parse_worktree_list_output(output: str) -> List[Dict[str, str]]:
-    """Parse `git worktree list --porcelain` output."""
-    entries: List[Dict[str, str]] = []
-    current: Dict[str, str] = {}
+    """Parse `git worktree list --porcelain` output.
 
-    for line in output.splitlines():
-        if not line.strip():
-            if current:
-                entries.append(current)
-                current = {}
-            continue
-
-        if " " not in line:
-            continue
+    Entries are separated by blank lines, so each block is parsed on its own;
+    attribute lines without a value (``bare``, ``detached``) are ignored.
+    """
+    entries: List[Dict[str, str]] = []
+    for block in output.strip().split("\n\n"):
+        entry = {
+            key: val.strip()
+            for key, _, val in (
+                line.partition(" ") for line in block.splitlines() if " " in line
+            )
+        }
+        if entry:
+            entries.append(entry)
+    return entries
 
-        parts = line.split(None, 1)
-        if len(parts) == 2:
-            key, val = parts[0], parts[1].strip()
-            current[key] = val
 
-    if current:
-        entries.append(current)
+def _parse_status_v2(output: str) -> Dict[str, Any]:
+    """Parse `git status --porcelain=v2 --branch [-z]` output.
 
-    return entries
+    Returns branch (None when detached), upstream, ahead/behind (None when
+    the `# branch.ab` header is absent) and whether any entry records
+    (tracked changes or untracked files) exist.
+    """
+    parsed: Dict[str, Any] = {
+        "branch": None,
+        "upstream": None,
+        "ahead": None,
+        "behind": None,
+        "is_clean": True,
+    }
+    records = output.split("\0") if "\0" in output else output.splitlines()
+    for line in records:
+        if not line:
+            continue
+        if not line.startswith("# "):
+            parsed["is_clean"] = False
+            continue
+        key, _, value = line[2:].partition(" ")
+        value = value.strip()
+        if key == "branch.head":
+            parsed["branch"] = value if value and value != "(detached)" else None
+        elif key == "branch.upstream":
+            parsed["upstream"] = value or None
+        elif key == "branch.ab":
+            parts = value.split()
+            if len(parts) == 2:
+                try:
+                    parsed["ahead"] = abs(int(parts[0]))
+                    parsed["behind"] = abs(int(parts[1]))
+                except ValueError:
+                    pass
+    return parsed
 
 
 def analyze_git_sync_risks(project_root: Path) -> Dict[str, Any]:
@@ -618,26 +662,19 @@ def analyze_git_sync_risks(project_root: Path) -> Dict[str, Any]:
         if status_rank[level] > status_rank[report["status"]]:
             report["status"] = level
 
-    if GIT_VALIDATOR_AVAILABLE:
-        in_git_repo = is_git_repository(str(project_root))
-    else:
-        exit_code, _, _ = _run_git(
-            ["rev-parse", "--is-inside-work-tree"],
-            cwd=str(project_root),
-            timeout=3,
-        )
-        in_git_repo = exit_code == 0
-
-    if not in_git_repo:
-        report["status"] = "skipped"
-        return report
-
+    # One status probe answers repo membership, branch, upstream and
+    # cleanliness; a non-zero exit means we are not inside a work tree.
     exit_code, stdout, _ = _run_git(
-        ["symbolic-ref", "--quiet", "--short", "HEAD"],
+        ["status", "--porcelain=v2", "--branch", "-z"],
         cwd=str(project_root),
         timeout=5,
     )
-    branch = stdout.strip() if exit_code == 0 and stdout.strip() else None
+    if exit_code != 0:
+        report["status"] = "skipped"
+        return report
+    status_v2 = _parse_status_v2(stdout)
+
+    branch = status_v2["branch"]
     report["branch"] = branch
     if not branch:
         add_issue(
@@ -677,18 +714,7 @@ def analyze_git_sync_risks(project_root: Path) -> Dict[str, Any]:
                 "Finish or abort it before new changes (e.g. git rebase --continue/--abort).",
             )
 
-    is_clean = True
-    if GIT_VALIDATOR_AVAILABLE:
-        is_clean = is_working_directory_clean(str(project_root))
-    else:
-        exit_code, stdout, _ = _run_git(
-            ["status", "--porcelain"],
-            cwd=str(project_root),
-            timeout=5,
-        )
-        is_clean = exit_code == 0 and not stdout.strip()
-
-    if not is_clean:
+    if not status_v2["is_clean"]:
         add_issue(
             "dirty_worktree",
             "warning",
@@ -698,13 +724,8 @@ def analyze_git_sync_risks(project_root: Path) -> Dict[str, Any]:
 
     upstream_ref: Optional[str] = None
     if branch:
-        exit_code, stdout, _ = _run_git(
-            ["rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{upstream}"],
-            cwd=str(project_root),
-            timeout=5,
-        )
-        if exit_code == 0 and stdout.strip():
-            upstream_ref = stdout.strip()
+        if status_v2["upstream"]:
+            upstream_ref = status_v2["upstream"]
             report["upstream"] = upstream_ref
         else:
             add_issue(
@@ -715,40 +736,54 @@ def analyze_git_sync_risks(project_root: Path) -> Dict[str, Any]:
             )
 
     if upstream_ref:
-        exit_code, stdout, _ = _run_git(
-            ["rev-list", "--left-right", "--count", "@{upstream}...HEAD"],
-            cwd=str(project_root),
-            timeout=5,
-        )
-        if exit_code == 0:
-            parts = stdout.strip().split()
+        ahead, behind = status_v2["ahead"], status_v2["behind"]
+        if ahead is None or behind is None:
+            # `# branch.ab` is omitted when git cannot compare with upstream
+            # (e.g. the upstream ref is missing); fall back to rev-list.
+            exit_code, stdout, _ = _run_git(
+                ["rev-list", "--left-right", "--count", "@{upstream}...HEAD"],
+                cwd=str(project_root),
+                timeout=5,
+            )
+            parts = stdout.strip().split() if exit_code == 0 else []
             if len(parts) == 2 and all(p.isdigit() for p in parts):
                 behind = int(parts[0])
                 ahead = int(parts[1])
-                report["behind"] = behind
-                report["ahead"] = ahead
-
-                if ahead > 0 and behind > 0:
-                    add_issue(
-                        "branch_diverged",
-                        "critical",
-                        f"Branch has diverged from upstream (ahead {ahead}, behind {behind}).",
-                        "Sync before coding: git fetch origin && git rebase @{upstream} (or merge).",
-                    )
-                elif behind > 0:
-                    add_issue(
-                        "branch_behind",
-                        "warning",
-                        f"Branch is behind upstream by {behind} commit(s).",
-                        "Update branch first: git fetch origin && git rebase @{upstream}.",
-                    )
-                elif ahead > 0:
-                    add_issue(
-                        "branch_ahead",
-                        "warning",
-                        f"Branch is ahead of upstream by {ahead} commit(s).",
-                        "Push when ready: git push.",
-                    )
+            else:
+                # Configured but unresolvable: the remote branch is gone.
+                report["upstream"] = None
+                add_issue(
+                    "no_upstream",
+                    "warning",
+                    f"Branch '{branch}' tracks '{upstream_ref}', which no longer exists.",
+                    f"Set upstream once: git push -u origin {branch}",
+                )
+
+        if ahead is not None and behind is not None:
+            report["behind"] = behind
+            report["ahead"] = ahead
+
+            if ahead > 0 and behind > 0:
+                add_issue(
+                    "branch_diverged",
+                    "critical",
+                    f"Branch has diverged from upstream (ahead {ahead}, behind {behind}).",
+                    "Sync before coding: git fetch origin && git rebase @{upstream} (or merge).",
+                )
+            elif behind > 0:
+                add_issue(
+                    "branch_behind",
+                    "warning",
+                    f"Branch is behind upstream by {behind} commit(s).",
+                    "Update branch first: git fetch origin && git rebase @{upstream}.",
+                )
+            elif ahead > 0:
+                add_issue(
+                    "branch_ahead",
+                    "warning",
+                    f"Branch is ahead of upstream by {ahead} commit(s).",
+                    "Push when ready: git push.",
+                )
 
     if branch:
         exit_code, stdout, _ = _run_git(
@@ -774,6 +809,10 @@ def analyze_git_sync_risks(project_root: Path) -> Dict[str, Any]:
                 worktree_path = entry.get("worktree")
                 if not worktree_path or entry.get("branch") != branch_ref:
                     continue
+                # git usually reports canonical paths; skip the resolve() syscalls
+                # when the entry already matches the current worktree verbatim.
+                if worktree_path == current_worktree:
+                    continue
 
                 try:
                     resolved_path = str(Path(worktree_path).resolve())
@@ -797,9 +836,62 @@ def analyze_git_sync_risks(project_root: Path) -> Dict[str, Any]:
     return report
 
 
+def _resolve_git_dir(project_root: Path) -> Optional[Path]:
+    """Return the (per-worktree) git dir for project_root, or None outside a repo."""
+    # Plain layouts are read from .git directly instead of forking git.
+    if not any(name in os.environ for name in _GIT_DISCOVERY_ENV):
+        found = _find_dotgit(project_root.resolve())
+        if found is None:
+            return None
+        if found[1] is not None:
+            return found[1]
+
+    exit_code, stdout, _ = _run_git(["rev-parse", "--absolute-git-dir"], cwd=str(project_root))
+    if exit_code != 0 or not stdout.strip():
+        return None
+    return Path(stdout.strip())
+
+
+def _get_git_sync_cache_path(project_root: Path) -> Optional[Path]:
+    git_dir = _resolve_git_dir(project_root)
+    return git_dir / GIT_SYNC_CACHE_FILENAME if git_dir is not None else None
+
+
+def _load_cached_git_sync_report(project_root: Path) -> Optional[Dict[str, Any]]:
+    """Return the cached sync report if it is younger than the TTL."""
+    cache_path = _get_git_sync_cache_path(project_root)
+    if cache_path is None:
+        return None
+    try:
+        if time.time() - cache_path.stat().st_mtime >= GIT_SYNC_CACHE_TTL_SECONDS:
+            return None
+        payload = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("project_root") != str(project_root):
+        return None
+    return payload
+
+
+def _store_git_sync_report(project_root: Path, report: Dict[str, Any]) -> None:
+    """Persist the sync report for reuse; only for already-tracked projects."""
+    if report.get("status") == "skipped" or not get_tracker_docs_root(project_root).is_dir():
+        return
+    cache_path = _get_git_sync_cache_path(project_root)
+    if cache_path is None:
+        return
+    try:
+        _atomic_write_text(cache_path, json.dumps(report))
+    except OSError as exc:
+        logger.debug("Could not write git sync cache: %s", exc)
+
+
 def git_sync_check(project_root: Path) -> bool:
     """Print actionable Git sync warnings."""
-    report = analyze_git_sync_risks(project_root)
+    report = _load_cached_git_sync_report(project_root)
+    if report is None:
+        report = analyze_git_sync_risks(project_root)
+        _store_git_sync_report(project_root, report)
     status = report.get("status", "ok")
 
     if status in ("ok", "skipped"):
@@ -931,8 +1023,9 @@ def _delete_remote_branch(remote: str, remote_branch: str, project_root: Path) -
 def _get_head_commit(project_root: Path) -> Optional[str]:
     """Resolve current HEAD commit hash, if available."""
     try:
-        if GIT_VALIDATOR_AVAILABLE:
-            head = get_current_commit_hash()
+        validator = _git_validator()
+        if validator is not None:
+            head = validator.get_current_commit_hash()
             return head if head else None
         result = subprocess.run(
             ["git", "rev-parse", "HEAD"],
@@ -13,9 +13,12 @@ Security Features:
 - Structured error handling
 """
 
+import atexit
 import re
+import shutil
 import subprocess
-from typing import List, Optional, Tuple
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 
 # Git commit hash pattern: 7-40 hexadecimal characters
@@ -27,12 +30,36 @@ COMMIT_HASH_PATTERN = re.compile(r'^[0-9a-fA-F]{7,40}$')
 # The dangerous combination '$(' is caught by the pattern check below.
 DANGEROUS_CHARS = [';', '&', '|', '$', '`', '<', '>', '\n', '\r', '\t']
 
+# Absolute path of the git binary, resolved on first use (see _git_executable).
+_GIT_EXECUTABLE: Optional[str] = None
+
+# Object types reported by `git cat-file --batch-check`.
+_GIT_OBJECT_TYPES = frozenset({'commit', 'tree', 'blob', 'tag'})
+
+# Shared GitBatch instances keyed by working directory (see get_git_batch).
+_GIT_BATCHES: Dict[Optional[str], 'GitBatch'] = {}
+
 
 class GitCommandError(Exception):
     """Exception raised when a Git command fails validation or execution."""
     pass
 
 
+def _git_executable() -> str:
+    """
+    Return the git binary path, searching PATH only once per process.
+
+    Hooks issue many short git calls; resolving the absolute path up front
+    lets every spawn exec the binary directly instead of probing each PATH
+    entry. Falls back to plain ``git`` so a missing binary still surfaces as
+    FileNotFoundError at execution time.
+    """
+    global _GIT_EXECUTABLE
+    if _GIT_EXECUTABLE is None:
+        _GIT_EXECUTABLE = shutil.which('git') or 'git'
+    return _GIT_EXECUTABLE
+
+
 def validate_commit_hash(commit_hash: str) -> bool:
     """
     Validate git commit hash format (7-40 hex chars).
@@ -146,9 +173,9 @@ def safe_git_command(
 
     # Build command (strip 'git' from args if present to avoid duplication)
     if args and args[0] == 'git':
-        cmd = args
+        cmd = [_git_executable()] + list(args[1:])
     else:
-        cmd = ['git'] + args
+        cmd = [_git_executable()] + list(args)
 
     try:
         result = subprocess.run(
@@ -176,25 +203,61 @@ def safe_git_command(
         )
 
 
-def is_git_repository(cwd: Optional[str] = None) -> bool:
+def get_git_info(cwd: Optional[str] = None) -> Dict[str, Any]:
     """
-    Check if the current directory (or cwd) is a Git repository.
+    Resolve repository membership, root and HEAD with a single git process.
+
+    ``git rev-parse`` accepts several queries at once and prints one answer
+    per line, stopping at the first query it cannot satisfy. An unborn HEAD
+    still reports the first two answers, so each field is parsed
+    independently instead of relying on the exit code alone.
 
     Args:
-        cwd: Directory to check (defaults to current directory)
+        cwd: Directory to inspect (defaults to current directory)
 
     Returns:
-        True if directory is a Git repository, False otherwise
+        Dict with keys ``is_repository`` (bool), ``is_inside_work_tree``
+        (bool), ``root`` (str or None) and ``head`` (str or None)
     """
+    info: Dict[str, Any] = {
+        "is_repository": False,
+        "is_inside_work_tree": False,
+        "root": None,
+        "head": None,
+    }
     try:
-        exit_code, _, _ = safe_git_command(
-            ['git', 'rev-parse', '--is-inside-work-tree'],
+        exit_code, stdout, _ = safe_git_command(
+            ['git', 'rev-parse', '--is-inside-work-tree', '--show-toplevel', 'HEAD'],
             cwd=cwd,
             timeout=5
         )
-        return exit_code == 0
     except GitCommandError:
-        return False
+        return info
+
+    lines = stdout.splitlines()
+    if not lines or lines[0] not in ("true", "false"):
+        return info
+
+    info["is_repository"] = True
+    info["is_inside_work_tree"] = lines[0] == "true"
+    if len(lines) >= 2 and lines[1].strip():
+        info["root"] = lines[1].strip()
+    if exit_code == 0 and len(lines) >= 3 and lines[2].strip():
+        info["head"] = lines[2].strip()
+    return info
+
+
+def is_git_repository(cwd: Optional[str] = None) -> bool:
+    """
+    Check if the current directory (or cwd) is a Git repository.
+
+    Args:
+        cwd: Directory to check (defaults to current directory)
+
+    Returns:
+        True if directory is a Git repository, False otherwise
+    """
+    return get_git_info(cwd)["is_repository"]
 
 
 def get_git_root(cwd: Optional[str] = None) -> Optional[str]:
@@ -207,17 +270,7 @@ def get_git_root(cwd: Optional[str] = None) -> Optional[str]:
     Returns:
         Path to Git repository root, or None if not in a repository
     """
-    try:
-        exit_code, stdout, _ = safe_git_command(
-            ['git', 'rev-parse', '--show-toplevel'],
-            cwd=cwd,
-            timeout=5
-        )
-        if exit_code == 0:
-            return stdout.strip()
-        return None
-    except GitCommandError:
-        return None
+    return get_git_info(cwd)["root"]
 
 
 def is_working_directory_clean(cwd: Optional[str] = None) -> bool:
@@ -253,14 +306,154 @@ def get_current_commit_hash(cwd: Optional[str] = None) -> Optional[str]:
     Returns:
         Current commit hash or None if not in a repository
     """
-    try:
-        exit_code, stdout, _ = safe_git_command(
-            ['git', 'rev-parse', 'HEAD'],
-            cwd=cwd,
-            timeout=5
-        )
-        if exit_code == 0:
-            return stdout.strip()
-        return None
-    except GitCommandError:
-        return None
+    return get_git_info(cwd)["head"]
+
+
+class GitBatch:
+    """
+    Persistent ``git cat-file --batch-check`` process for repeated object probes.
+
+    Each probe writes one ref per line to the child's stdin and reads one
+    reply line, so checking N refs costs a single git spawn instead of N.
+    The process is started lazily on first use and closed at interpreter
+    exit. A missing object is reported as None/False; failing to run git
+    at all raises GitCommandError so callers can tell the two apart.
+
+    Examples:
+        >>> batch = GitBatch()
+        >>> batch.exists('HEAD')
+        True
+    """
+
+    def __init__(self, cwd: Optional[str] = None, timeout: float = 30):
+        self.cwd = cwd
+        self.timeout = timeout
+        self._proc: Optional[subprocess.Popen] = None
+        self._atexit_registered = False
+
+    def __enter__(self) -> 'GitBatch':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+        try:
+            self._proc = subprocess.Popen(
+                [_git_executable(), 'cat-file', '--batch-check=%(objectname) %(objecttype)'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=self.cwd,
+                text=True,
+                bufsize=1,
+            )
+        except OSError as e:
+            self._proc = None
+            raise GitCommandError(f"Failed to start git cat-file: {e}")
+        if not self._atexit_registered:
+            atexit.register(self.close)
+            self._atexit_registered = True
+        return self._proc
+
+    def resolve(self, ref: str) -> Optional[Tuple[str, str]]:
+        """
+        Resolve a ref, revision expression or object name.
+
+        Args:
+            ref: Anything ``git cat-file`` accepts, e.g. a commit hash,
+                ``refs/heads/main`` or ``<hash>^{commit}``
+
+        Returns:
+            Tuple of (object_name, object_type), or None when the object is
+            missing or ambiguous
+
+        Raises:
+            GitCommandError: If git cannot be run, exits (e.g. outside a
+                repository) or does not answer within ``timeout`` seconds
+        """
+        # A newline would split the request and desynchronize the protocol.
+        if not ref or not isinstance(ref, str) or any(c in ref for c in ('\n', '\r', '\0')):
+            return None
+
+        proc = self._ensure_started()
+        # readline() cannot time out on a pipe; kill the child instead, which
+        # ends the read with EOF.
+        timed_out = threading.Event()
+
+        def _kill() -> None:
+            timed_out.set()
+            proc.kill()
+
+        watchdog = threading.Timer(self.timeout, _kill)
+        watchdog.start()
+        try:
+            proc.stdin.write(ref + '\n')
+            proc.stdin.flush()
+            reply = proc.stdout.readline()
+        except (OSError, ValueError) as e:
+            reply, failure = '', f"git cat-file pipe failed: {e}"
+        else:
+            failure = "git cat-file exited; is this a git repository?"
+        finally:
+            watchdog.cancel()
+        if not reply:
+            self.close()
+            if timed_out.is_set():
+                failure = f"git cat-file timed out after {self.timeout} seconds"
+            raise GitCommandError(failure)
+
+        object_name, _, object_type = reply.rstrip('\n').rpartition(' ')
+        if object_type not in _GIT_OBJECT_TYPES:
+            return None
+        return object_name, object_type
+
+    def exists(self, ref: str) -> bool:
+        """
+        Check whether a ref or object name resolves in the repository.
+
+        Args:
+            ref: Ref, revision expression or object name to probe
+
+        Returns:
+            True if git resolves it to an object, False otherwise
+
+        Raises:
+            GitCommandError: If git cannot answer (see ``resolve``)
+        """
+        return self.resolve(ref) is not None
+
+    def close(self) -> None:
+        """Stop the child process; safe to call more than once."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+        finally:
+            if proc.stdout:
+                proc.stdout.close()
+
+
+def get_git_batch(cwd: Optional[str] = None) -> GitBatch:
+    """
+    Return the shared GitBatch for a working directory.
+
+    Args:
+        cwd: Repository directory (defaults to current directory)
+
+    Returns:
+        A GitBatch reused by every caller probing the same directory
+    """
+    batch = _GIT_BATCHES.get(cwd)
+    if batch is None:
+        batch = GitBatch(cwd)
+        _GIT_BATCHES[cwd] = batch
+    return batch
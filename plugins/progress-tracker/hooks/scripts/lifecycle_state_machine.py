@@ -15,6 +15,7 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 
 import audit_log
+import state_io
 
 
 LOCK_FILENAME = "progress.lock"
@@ -56,7 +57,7 @@ def acquire_lock(lock_path: Path, timeout: float = LOCK_TIMEOUT_SECONDS):
 def _atomic_write(filepath: Path, content: str):
     """原子写入：临时文件 + fsync + rename"""
     temp_path = filepath.with_suffix(".tmp")
-    with open(temp_path, 'w') as f:
+    with open(temp_path, 'w', encoding='utf-8') as f:
         f.write(content)
         f.flush()
         os.fsync(f.fileno())
@@ -142,8 +143,7 @@ def load_progress_json(project_root: Optional[str] = None) -> Dict[str, Any]:
     if not progress_file.exists():
         return {}
 
-    with open(progress_file, 'r') as f:
-        return json.load(f)
+    return state_io._load_json_bytes(progress_file.read_bytes())
 
 
 def get_feature(feature_id: int, project_root: Optional[str] = None) -> Optional[Dict[str, Any]]:
@@ -163,8 +163,7 @@ def _save_progress_json(data: Dict[str, Any], project_root: Optional[str] = None
     state_dir.mkdir(parents=True, exist_ok=True)
     progress_file = state_dir / "progress.json"
 
-    with open(progress_file, 'w') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    _atomic_write(progress_file, state_io._dump_json_text(data))
 
 
 def validate_transition(
@@ -406,7 +405,7 @@ def _execute_transition(
         # 2. 写入 progress.json
         try:
             data["updated_at"] = current_time
-            _atomic_write(progress_path, json.dumps(data, indent=2, ensure_ascii=False))
+            _atomic_write(progress_path, state_io._dump_json_text(data))
         except Exception as e:
             # progress.json 写失败：追加失败审计记录
             failure_record = {
@@ -19,6 +19,7 @@ Storage layout:
 from __future__ import annotations
 
 import json
+import os
 import shutil
 import subprocess
 from datetime import datetime, timezone
@@ -48,11 +49,52 @@ class ProjectRootResolutionError(RuntimeError):
     """Raised when target project root cannot be resolved safely."""
 
 
+# Resolved project roots keyed by (override, cwd). Resolution shells out to
+# `git rev-parse`, and one CLI command resolves the root many times.
+_PROJECT_ROOT_CACHE: Dict[Tuple[str, str], Path] = {}
+
+
+def clear_project_root_cache() -> None:
+    """Drop memoized project roots (after re-init/reset, or between tests)."""
+    _PROJECT_ROOT_CACHE.clear()
+
+
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+# Env vars that let git resolve a repo somewhere other than the nearest .git.
+_GIT_DISCOVERY_ENV = ("GIT_DIR", "GIT_WORK_TREE", "GIT_CEILING_DIRECTORIES")
+
+
+def _find_dotgit(cwd: Path) -> Optional[Tuple[Path, Optional[Path]]]:
+    """Walk up from cwd to the nearest .git dir (with HEAD) or .git file.
+
+    Returns ``(work_tree, git_dir)``. For a .git file (linked worktree,
+    submodule) git_dir follows its ``gitdir:`` pointer, and is None when the
+    file has no readable pointer.
+    """
+    for candidate in (cwd, *cwd.parents):
+        marker = candidate / ".git"
+        if (marker / "HEAD").is_file():
+            return candidate, marker
+        if marker.is_file():
+            try:
+                content = marker.read_text(encoding="utf-8").strip()
+            except OSError:
+                return candidate, None
+            if not content.startswith("gitdir:"):
+                return candidate, None
+            git_dir = Path(content[len("gitdir:"):].strip())
+            return candidate, git_dir if git_dir.is_absolute() else candidate / git_dir
+    return None
+
+
 def _git_root(cwd: Path) -> Optional[Path]:
+    # Plain layouts are resolved with a few stat() calls instead of forking git.
+    if not any(name in os.environ for name in _GIT_DISCOVERY_ENV):
+        found = _find_dotgit(cwd.resolve())
+        return found[0] if found else None
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
@@ -229,14 +271,21 @@ def find_project_root(override: Optional[str | Path] = None) -> Path:
     """
     Resolve target project root.
     If override is provided, prioritize it. Otherwise, auto-detect it.
+
+    Results are memoized per (override, cwd); call clear_project_root_cache()
+    when the layout under cwd changes within one process.
     """
-    if override is not None:
-        if isinstance(override, Path):
-            return override.resolve()
-        target_root, _ = resolve_target_project_root(project_root_arg=str(override))
-        return target_root
+    if isinstance(override, Path):
+        return override.resolve()
+
+    cache_key = ("" if override is None else str(override), os.getcwd())
+    cached = _PROJECT_ROOT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
 
-    target_root, _ = resolve_target_project_root(project_root_arg=None)
+    project_root_arg = None if override is None else str(override)
+    target_root, _ = resolve_target_project_root(project_root_arg=project_root_arg)
+    _PROJECT_ROOT_CACHE[cache_key] = target_root
     return target_root
 
 
@@ -44,6 +44,7 @@ import re
 import shlex
 import sys
 import copy
+import functools
 import subprocess
 import shutil
 import logging
@@ -87,6 +88,7 @@ from prog_paths import (
     get_tracker_docs_root,
     rel_progress_path,
     resolve_target_project_root,
+    clear_project_root_cache,
     find_project_root as _find_project_root_impl,
 )
 from contract_importer import ContractImporter, ContractImportError
@@ -150,6 +152,19 @@ def progress_transaction(
     with lock_manager.progress_transaction(timeout_seconds=timeout_seconds, project_root=root):
         yield
 progress_transaction.is_wrapper = True
+
+
+def _locked_progress_mutation(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Run an API-level load -> mutate -> save entry point under progress_transaction().
+
+    main() already holds the lock for MUTATING_COMMANDS; the lock is re-entrant,
+    so this only adds protection for direct Python callers (hooks, MCP).
+    """
+    @functools.wraps(func)
+    def locked(*args: Any, **kwargs: Any) -> Any:
+        with progress_transaction():
+            return func(*args, **kwargs)
+    return locked
 import completion_flow
 from completion_flow import FINISH_PENDING_STATE, _is_project_fully_completed
 import progress_prompt_builders
@@ -219,7 +234,8 @@ try:
         is_git_repository,
         get_git_root,
         is_working_directory_clean,
-        get_current_commit_hash
+        get_current_commit_hash,
+        get_git_batch,
     )
     GIT_VALIDATOR_AVAILABLE = True
 except ImportError:
@@ -252,6 +268,7 @@ DEFAULT_LINKED_STATUS_STALE_HOURS = 24
 ROOT_ROUTE_CODE = "ROOT"
 DEVELOPMENT_STAGES = ("planning", "developing", "completed")
 VALID_FINISH_STATES = ("merged_and_cleaned", "pr_open", "kept_with_reason")
+AI_METRICS_MODELS = ("haiku", "opus", "sonnet")
 # FINISH_PENDING_STATE is imported from completion_flow
 # Canonical relative paths (from project root) that must never be moved or deleted
 # by archive_feature_docs or any other done-flow mutation.
@@ -332,6 +349,7 @@ logger = logging.getLogger(__name__)
 _PROJECT_ROOT_OVERRIDE: Optional[Path] = None
 _REPO_ROOT: Optional[Path] = None
 _STORAGE_READY_ROOT: Optional[Path] = None
+_STORAGE_READY_STATE_DIR: Optional[Path] = None
 
 
 def get_plugin_root():
@@ -407,30 +425,30 @@ def validate_plugin_root(path):
     """
     path = Path(path)
 
-    # Check if path exists
-    if not path.exists():
+    # One directory read answers "exists" plus the top-level markers, and
+    # candidates without hooks/ are rejected before any deeper stat.
+    try:
+        with os.scandir(path) as entries:
+            top_level = {entry.name for entry in entries}
+    except OSError:
+        return False
+    if "hooks" not in top_level:
         return False
-
-    # Check for key plugin files
-    has_hooks_json = (path / "hooks" / "hooks.json").exists()
-    has_progress_manager = (path / "hooks" / "scripts" / "progress_manager.py").exists()
-    has_skills = (path / "skills").exists()
-    has_commands = (path / "commands").exists()
 
     # At minimum, should have the progress_manager script
-    if has_progress_manager:
+    if (path / "hooks" / "scripts" / "progress_manager.py").exists():
         return True
 
     # Or hooks.json if using direct script loading
-    if has_hooks_json and (has_skills or has_commands):
-        return True
+    if "skills" in top_level or "commands" in top_level:
+        return (path / "hooks" / "hooks.json").exists()
 
     return False
 
 
 def configure_project_scope(project_root_arg: Optional[str]) -> bool:
     """Resolve and lock the target project root for this process."""
-    global _PROJECT_ROOT_OVERRIDE, _REPO_ROOT, _STORAGE_READY_ROOT
+    global _PROJECT_ROOT_OVERRIDE, _REPO_ROOT, _STORAGE_READY_ROOT, _STORAGE_READY_STATE_DIR
     try:
         target_root, repo_root = resolve_target_project_root(project_root_arg=project_root_arg)
     except ProjectRootResolutionError as exc:
@@ -442,6 +460,8 @@ def configure_project_scope(project_root_arg: Optional[str]) -> bool:
     _PROJECT_ROOT_OVERRIDE = target_root if project_root_arg else None
     _REPO_ROOT = repo_root
     _STORAGE_READY_ROOT = None
+    _STORAGE_READY_STATE_DIR = None
+    clear_project_root_cache()
     return True
 
 
@@ -459,12 +479,20 @@ def find_project_root() -> Path:
     return _find_project_root_impl(override=_PROJECT_ROOT_OVERRIDE)
 
 
-def _ensure_storage_ready() -> None:
-    """Ensure new docs/progress-tracker layout exists and legacy data is migrated once."""
-    global _STORAGE_READY_ROOT
+def _ensure_storage_ready() -> Path:
+    """
+    Ensure new docs/progress-tracker layout exists and legacy data is migrated once.
+
+    Returns the state directory for the resolved project root.
+    """
+    global _STORAGE_READY_ROOT, _STORAGE_READY_STATE_DIR
     target_root = find_project_root()
-    if _STORAGE_READY_ROOT is not None and _STORAGE_READY_ROOT == target_root:
-        return
+    if (
+        _STORAGE_READY_ROOT is not None
+        and _STORAGE_READY_STATE_DIR is not None
+        and _STORAGE_READY_ROOT == target_root
+    ):
+        return _STORAGE_READY_STATE_DIR
     ensure_tracker_layout(target_root)
     migration_result = ensure_storage_migrated(target_root)
     if migration_result.get("migrated"):
@@ -473,12 +501,13 @@ def _ensure_storage_ready() -> None:
             f"for project root: {target_root}"
         )
     _STORAGE_READY_ROOT = target_root
+    _STORAGE_READY_STATE_DIR = get_state_dir(target_root)
+    return _STORAGE_READY_STATE_DIR
 
 
 def get_progress_dir() -> Path:
     """Get docs/progress-tracker/state directory for progress tracking."""
-    _ensure_storage_ready()
-    return get_state_dir(find_project_root())
+    return _ensure_storage_ready()
 
 
 def validate_plan_path(
@@ -568,14 +597,12 @@ def _resolve_main_repo_path(project_root: Path) -> Path:
     if main_root is None:
         return project_root.resolve()
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"],
-            cwd=str(project_root),
-            capture_output=True,
-            text=True,
-            check=True,
+        exit_code, stdout, _ = _run_git(
+            ["rev-parse", "--show-toplevel"], cwd=str(project_root), timeout=5
         )
-        wt_root = Path(result.stdout.strip()).resolve()
+        if exit_code != 0 or not stdout.strip():
+            return project_root.resolve()
+        wt_root = Path(stdout.strip()).resolve()
         rel_path = project_root.resolve().relative_to(wt_root)
         return (main_root / rel_path).resolve()
     except Exception:
@@ -765,7 +792,7 @@ def _save_progress_payload_at_root(
             data["updated_at"] = _iso_now()
         _atomic_write_text(
             get_progress_json_path(project_root),
-            json.dumps(data, indent=2, ensure_ascii=False),
+            state_io._dump_json_text(data),
         )
         state_io.save_progress_md(get_state_dir(project_root), "")
 
@@ -1337,8 +1364,8 @@ def load_progress_json(progress_dir: Optional[Path] = None) -> Optional[Dict[str
 
 
 def _iso_now() -> str:
-    """Return current local timestamp with trailing Z for compatibility."""
-    return datetime.now().isoformat() + "Z"
+    """Return current UTC timestamp in ISO 8601 format with Z suffix."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
 def _append_audit_event(
@@ -1704,8 +1731,7 @@ def _load_progress_history() -> List[Dict[str, Any]]:
     if not history_path.exists():
         return []
     try:
-        with open(history_path, "r", encoding="utf-8") as f:
-            payload = json.load(f)
+        payload = state_io._load_json_bytes(history_path.read_bytes())
         if isinstance(payload, list):
             return [item for item in payload if isinstance(item, dict)]
     except (json.JSONDecodeError, OSError):
@@ -1987,8 +2013,15 @@ def determine_complexity_bucket(score: int) -> str:
 
 def _parse_iso_timestamp(value: Optional[str]) -> Optional[datetime]:
     """Parse ISO-8601 timestamps with optional trailing Z."""
-    if not value:
+    if not value or not isinstance(value, str):
         return None
+    return _parse_iso_timestamp_cached(value)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_iso_timestamp_cached(value: str) -> Optional[datetime]:
+    # Memoized per string: the same last_checkpoint_at / updated_at values are
+    # re-parsed on every hook tick, and datetime results are immutable.
     try:
         parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
         if parsed.tzinfo is None:
@@ -2123,7 +2156,7 @@ def save_checkpoints(data: Dict[str, Any], path: Optional[Path] = None) -> None:
         progress_dir = get_progress_dir()
         progress_dir.mkdir(parents=True, exist_ok=True)
         checkpoints_path = path or (progress_dir / CHECKPOINTS_JSON)
-        payload = json.dumps(data, indent=2, ensure_ascii=False)
+        payload = state_io._dump_json_text(data)
         _atomic_write_text(checkpoints_path, payload)
 
 
@@ -2417,11 +2450,12 @@ def _cmd_wf_auto_driver() -> bool:
         if not wf or not isinstance(wf, dict):
             return True
         wf["pending_action"] = pending_action
-        _atomic_write_text(progress_path, json.dumps(fresh, indent=2, ensure_ascii=False))
+        _atomic_write_text(progress_path, state_io._dump_json_text(fresh))
 
     return True
 
 
+@_locked_progress_mutation
 def init_tracking(project_name, features=None, force=False, confirm_destroy=False):
     """
     Initialize progress tracking for a project.
@@ -2448,6 +2482,7 @@ def init_tracking(project_name, features=None, force=False, confirm_destroy=Fals
     archived_entry = None
     existing_parent_root: Optional[str] = None
     if force:
+        clear_project_root_cache()
         existing = load_progress_json()
         if isinstance(existing, dict):
             if not confirm_destroy:
@@ -2476,7 +2511,7 @@ def init_tracking(project_name, features=None, force=False, confirm_destroy=Fals
     is_parent_root = (target_root / "plugins").is_dir()
 
     # Create initial progress structure
-    now = datetime.now().isoformat() + "Z"
+    now = _iso_now()
     data = {
         "schema_version": CURRENT_SCHEMA_VERSION,
         "project_name": project_name,
@@ -2923,8 +2958,7 @@ def _check_other_worktrees_for_incomplete_work(current_worktree: str) -> List[Di
             continue
 
         try:
-            with open(progress_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = state_io._load_json_bytes(progress_file.read_bytes())
 
             features = data.get("features", [])
             incomplete = [
@@ -2962,226 +2996,236 @@ def check(output_json: bool = False):
     Args:
         output_json: If True, emit only machine-readable JSON output without text messages.
     """
-    # Check for incomplete work in other worktrees
-    current_root = str(find_project_root())
-    other_worktrees_with_work = _check_other_worktrees_for_incomplete_work(current_root)
-
     # Check current worktree for incomplete work
     data = load_progress_json()
     if not data:
         return 0  # No tracking = nothing to recover
 
-    reconcile_report = analyze_reconcile_state(data)
     features = data.get("features", [])
-    incomplete = [
-        f
-        for f in features
-        if isinstance(f, dict) and not f.get("completed", False)
-    ]
-    actionable_incomplete = [f for f in incomplete if not _is_feature_deferred(f)]
-    deferred_incomplete = [f for f in incomplete if _is_feature_deferred(f)]
+    actionable_incomplete = []
+    deferred_incomplete = []
+    for f in features:
+        if not isinstance(f, dict) or f.get("completed", False):
+            continue
+        if _is_feature_deferred(f):
+            deferred_incomplete.append(f)
+        else:
+            actionable_incomplete.append(f)
 
-    if incomplete:
-        current_id = data.get("current_feature_id")
+    # All done: skip drift analysis and the worktree scan, which both shell out to git
+    if not actionable_incomplete and not deferred_incomplete:
+        return 0
 
-        if not actionable_incomplete and current_id is None:
-            print(
-                json.dumps(
-                    {
-                        "status": "deferred_only",
-                        "project_name": data.get("project_name", "Unknown"),
-                        "deferred_count": len(deferred_incomplete),
-                        "total_features": len(features),
-                        "recommendation": "resume_deferred_features",
-                        "drift_diagnosis": reconcile_report.get("diagnosis"),
-                        "drift_recommended_next_step": reconcile_report.get(
-                            "recommended_next_step"
-                        ),
-                        "message": (
-                            "All pending features are deferred. "
-                            "Use `prog resume --all` or `prog resume --defer-group <group>` "
-                            "when you want to continue."
-                        ),
-                    }
-                )
-            )
-            return 0
-
-        # First, show info about other worktrees with incomplete work (if any)
-        # This is informational only - doesn't block current worktree recovery
-        if other_worktrees_with_work:
-            wt_list = []
-            for wt in other_worktrees_with_work[:3]:  # Show at most 3 worktrees
-                wt_info = (
-                    f"{wt['worktree_path']} "
-                    f"({wt['project_name']}: actionable={wt['incomplete_count']}, "
-                    f"deferred={wt.get('deferred_count', 0)})"
-                )
-                wt_list.append(wt_info)
-
-            info_msg = f"[Progress Tracker] ℹ️ 注意：其他 worktree 中也有未完成的工作\n"
-            info_msg += f"其他 worktree: {'; '.join(wt_list)}\n"
-            info_msg += f"如需切换，使用: cd <worktree_path>\n"
+    reconcile_report = analyze_reconcile_state(data)
+    current_id = data.get("current_feature_id")
 
-            if not output_json:
-                print(json.dumps({
-                    "status": "info_other_worktrees",
-                    "message": info_msg,
-                    "other_worktrees": other_worktrees_with_work[:3],
+    if not actionable_incomplete and current_id is None:
+        print(
+            json.dumps(
+                {
+                    "status": "deferred_only",
+                    "project_name": data.get("project_name", "Unknown"),
+                    "deferred_count": len(deferred_incomplete),
+                    "total_features": len(features),
+                    "recommendation": "resume_deferred_features",
                     "drift_diagnosis": reconcile_report.get("diagnosis"),
                     "drift_recommended_next_step": reconcile_report.get(
                         "recommended_next_step"
                     ),
-                }))
-
-        # Then proceed with current worktree recovery
-        project_name = data.get("project_name", "Unknown")
-        total = len(features)
-        completed = sum(1 for f in features if isinstance(f, dict) and f.get("completed", False))
-        workflow_state = data.get("workflow_state", {})
-
-        # If there's a feature in progress, provide detailed recovery info
-        if current_id is not None:
-            feature = next((f for f in features if f.get("id") == current_id), None)
-            if feature:
-                if _is_feature_deferred(feature):
-                    print(
-                        json.dumps(
-                            {
-                                "status": "needs_manual_review",
-                                "feature_id": current_id,
-                                "feature_name": feature.get("name", "Unknown"),
-                                "reason": "current_feature_deferred",
-                                "recommendation": "clear_or_resume_current_feature",
-                                "message": (
-                                    "Current feature is marked deferred. "
-                                    "Run `prog resume --all` (or by group), or clear current feature state."
-                                ),
-                            }
-                        )
-                    )
-                    return 1
-
-                phase = workflow_state.get("phase", "unknown")
-                plan_path = workflow_state.get("plan_path", "")
-                completed_tasks = workflow_state.get("completed_tasks", [])
-                total_tasks = workflow_state.get("total_tasks", 0)
-                checkpoints = load_checkpoints()
-                latest_checkpoint = _latest_checkpoint_entry(checkpoints)
-                latest_feature_checkpoint = _latest_checkpoint_entry_for_feature(checkpoints, current_id)
-                latest_checkpoint_context = _build_checkpoint_context(latest_checkpoint)
-                latest_feature_checkpoint_context = _build_checkpoint_context(latest_feature_checkpoint)
-                execution_context = workflow_state.get("execution_context")
-                expected_context = execution_context
-                if not isinstance(expected_context, dict) or not (
-                    expected_context.get("worktree_path") or expected_context.get("branch")
-                ):
-                    expected_context = latest_feature_checkpoint_context
-
-                # Build a live context snapshot for comparison without persisting it.
-                current_context = build_runtime_context(data, source="manual")
-                context_hint = compare_contexts(expected_context, current_context)
-                if (
-                    context_hint.get("status") == "unknown"
-                    and latest_feature_checkpoint_context
-                    and latest_feature_checkpoint_context is not expected_context
-                ):
-                    # Fallback compare if execution_context existed but was incomplete.
-                    context_hint = compare_contexts(latest_feature_checkpoint_context, current_context)
-
-                # Determine recovery recommendation
-                recommendation = determine_recovery_action(
-                    phase, feature, completed_tasks, total_tasks, plan_path=plan_path
-                )
-                plan_validation = validate_plan_path(
-                    plan_path,
-                    require_exists=phase in [
-                        "planning:draft", "planning:approved",
-                        "planning_complete", "execution", "execution_complete",
-                    ],
-                )
-
-                # Build a user-friendly recovery message
-                recovery_message = f"[Progress Tracker] 恢复功能开发: {feature.get('name', 'Unknown')}\n"
-                recovery_message += f"阶段: {phase}\n"
-                if plan_path:
-                    recovery_message += f"Plan 文档: {plan_path}\n"
-
-                # Add worktree switch hint if context mismatch
-                if context_hint.get("status") in ("mismatch", "path_mismatch"):
-                    expected_path = context_hint.get("expected_worktree_path")
-                    if expected_path and expected_path != context_hint.get("current_worktree_path"):
-                        recovery_message += f"\n⚠️ 当前会话不在上次执行的工作目录中\n"
-                        recovery_message += f"上次执行位置: {expected_path}\n"
-                        recovery_message += f"当前位置: {context_hint.get('current_worktree_path')}\n"
-                        recovery_message += f"\n💡 切换到正确的工作目录:\n"
-                        recovery_message += f"   cd {expected_path}\n"
-
-                recovery_info = {
-                    "status": "incomplete",
-                    "feature_id": current_id,
-                    "feature_name": feature.get("name", "Unknown"),
-                    "phase": phase,
-                    "plan_path": plan_path,
-                    "plan_path_valid": plan_validation["valid"],
-                    "plan_path_error": plan_validation["error"],
-                    "completed_tasks": completed_tasks,
-                    "total_tasks": total_tasks,
-                    "recommendation": recommendation,
-                    "context_hint": context_hint,
-                    "drift": reconcile_report,
-                    "recovery_message": recovery_message,
-                    "last_checkpoint_hint": (
-                        {
-                            "timestamp": latest_checkpoint.get("timestamp"),
-                            "feature_id": latest_checkpoint.get("feature_id"),
-                            "feature_name": latest_checkpoint.get("feature_name"),
-                            "phase": latest_checkpoint.get("phase"),
-                            "current_task": latest_checkpoint.get("current_task"),
-                            "total_tasks": latest_checkpoint.get("total_tasks"),
-                            "next_action": latest_checkpoint.get("next_action"),
-                            "branch": latest_checkpoint.get("branch"),
-                            "worktree_path": latest_checkpoint.get("worktree_path"),
-                        }
-                        if latest_checkpoint
-                        else None
+                    "message": (
+                        "All pending features are deferred. "
+                        "Use `prog resume --all` or `prog resume --defer-group <group>` "
+                        "when you want to continue."
                     ),
                 }
+            )
+        )
+        return 0
 
-                print(json.dumps(recovery_info))
-                return 1
+    # First, show info about other worktrees with incomplete work (if any)
+    # This is informational only - doesn't block current worktree recovery
+    current_root = str(find_project_root())
+    other_worktrees_with_work = _check_other_worktrees_for_incomplete_work(current_root)
+    if other_worktrees_with_work:
+        wt_list = []
+        for wt in other_worktrees_with_work[:3]:  # Show at most 3 worktrees
+            wt_info = (
+                f"{wt['worktree_path']} "
+                f"({wt['project_name']}: actionable={wt['incomplete_count']}, "
+                f"deferred={wt.get('deferred_count', 0)})"
+            )
+            wt_list.append(wt_info)
 
-        # General incomplete status (no specific feature in progress)
-        result = {
-            "status": "incomplete",
-            "project_name": project_name,
-            "completed": completed,
-            "total": total,
-            "actionable_count": len(actionable_incomplete),
-            "deferred_count": len(deferred_incomplete),
-            "drift_diagnosis": reconcile_report.get("diagnosis"),
-            "drift_recommended_next_step": reconcile_report.get("recommended_next_step"),
-        }
+        info_msg = f"[Progress Tracker] ℹ️ 注意：其他 worktree 中也有未完成的工作\n"
+        info_msg += f"其他 worktree: {'; '.join(wt_list)}\n"
+        info_msg += f"如需切换，使用: cd <worktree_path>\n"
 
         if not output_json:
-            print(f"[Progress Tracker] Unfinished project detected: {project_name}")
-            print(f"Progress: {completed}/{total} completed")
-            if reconcile_report.get("diagnosis") != "in_sync":
+            print(json.dumps({
+                "status": "info_other_worktrees",
+                "message": info_msg,
+                "other_worktrees": other_worktrees_with_work[:3],
+                "drift_diagnosis": reconcile_report.get("diagnosis"),
+                "drift_recommended_next_step": reconcile_report.get(
+                    "recommended_next_step"
+                ),
+            }))
+
+    # Then proceed with current worktree recovery
+    project_name = data.get("project_name", "Unknown")
+    total = len(features)
+    # One pass for the completed count and the current feature lookup
+    completed = 0
+    current_feature = None
+    for f in features:
+        if not isinstance(f, dict):
+            continue
+        if f.get("completed", False):
+            completed += 1
+        if current_feature is None and current_id is not None and f.get("id") == current_id:
+            current_feature = f
+    workflow_state = data.get("workflow_state", {})
+
+    # If there's a feature in progress, provide detailed recovery info
+    if current_id is not None:
+        feature = current_feature
+        if feature:
+            if _is_feature_deferred(feature):
                 print(
-                    "[Progress Tracker] Reality check: "
-                    f"{reconcile_report.get('diagnosis')} -> "
-                    f"{reconcile_report.get('recommended_next_step')}"
+                    json.dumps(
+                        {
+                            "status": "needs_manual_review",
+                            "feature_id": current_id,
+                            "feature_name": feature.get("name", "Unknown"),
+                            "reason": "current_feature_deferred",
+                            "recommendation": "clear_or_resume_current_feature",
+                            "message": (
+                                "Current feature is marked deferred. "
+                                "Run `prog resume --all` (or by group), or clear current feature state."
+                            ),
+                        }
+                    )
                 )
-            if actionable_incomplete:
-                print("Use '/prog' to view status or '/prog-next' to continue")
-            else:
-                print("Only deferred pending features remain. Use `prog resume --all` to continue.")
-        else:
-            print(json.dumps(result))
+                return 1
+
+            phase = workflow_state.get("phase", "unknown")
+            plan_path = workflow_state.get("plan_path", "")
+            completed_tasks = workflow_state.get("completed_tasks", [])
+            total_tasks = workflow_state.get("total_tasks", 0)
+            checkpoints = load_checkpoints()
+            latest_checkpoint = _latest_checkpoint_entry(checkpoints)
+            latest_feature_checkpoint = _latest_checkpoint_entry_for_feature(checkpoints, current_id)
+            latest_checkpoint_context = _build_checkpoint_context(latest_checkpoint)
+            latest_feature_checkpoint_context = _build_checkpoint_context(latest_feature_checkpoint)
+            execution_context = workflow_state.get("execution_context")
+            expected_context = execution_context
+            if not isinstance(expected_context, dict) or not (
+                expected_context.get("worktree_path") or expected_context.get("branch")
+            ):
+                expected_context = latest_feature_checkpoint_context
+
+            # Build a live context snapshot for comparison without persisting it.
+            current_context = build_runtime_context(data, source="manual")
+            context_hint = compare_contexts(expected_context, current_context)
+            if (
+                context_hint.get("status") == "unknown"
+                and latest_feature_checkpoint_context
+                and latest_feature_checkpoint_context is not expected_context
+            ):
+                # Fallback compare if execution_context existed but was incomplete.
+                context_hint = compare_contexts(latest_feature_checkpoint_context, current_context)
+
+            # Determine recovery recommendation
+            recommendation = determine_recovery_action(
+                phase, feature, completed_tasks, total_tasks, plan_path=plan_path
+            )
+            plan_validation = validate_plan_path(
+                plan_path,
+                require_exists=phase in [
+                    "planning:draft", "planning:approved",
+                    "planning_complete", "execution", "execution_complete",
+                ],
+            )
 
-        return 1 if actionable_incomplete else 0
+            # Build a user-friendly recovery message
+            recovery_message = f"[Progress Tracker] 恢复功能开发: {feature.get('name', 'Unknown')}\n"
+            recovery_message += f"阶段: {phase}\n"
+            if plan_path:
+                recovery_message += f"Plan 文档: {plan_path}\n"
+
+            # Add worktree switch hint if context mismatch
+            if context_hint.get("status") in ("mismatch", "path_mismatch"):
+                expected_path = context_hint.get("expected_worktree_path")
+                if expected_path and expected_path != context_hint.get("current_worktree_path"):
+                    recovery_message += f"\n⚠️ 当前会话不在上次执行的工作目录中\n"
+                    recovery_message += f"上次执行位置: {expected_path}\n"
+                    recovery_message += f"当前位置: {context_hint.get('current_worktree_path')}\n"
+                    recovery_message += f"\n💡 切换到正确的工作目录:\n"
+                    recovery_message += f"   cd {expected_path}\n"
+
+            recovery_info = {
+                "status": "incomplete",
+                "feature_id": current_id,
+                "feature_name": feature.get("name", "Unknown"),
+                "phase": phase,
+                "plan_path": plan_path,
+                "plan_path_valid": plan_validation["valid"],
+                "plan_path_error": plan_validation["error"],
+                "completed_tasks": completed_tasks,
+                "total_tasks": total_tasks,
+                "recommendation": recommendation,
+                "context_hint": context_hint,
+                "drift": reconcile_report,
+                "recovery_message": recovery_message,
+                "last_checkpoint_hint": (
+                    {
+                        "timestamp": latest_checkpoint.get("timestamp"),
+                        "feature_id": latest_checkpoint.get("feature_id"),
+                        "feature_name": latest_checkpoint.get("feature_name"),
+                        "phase": latest_checkpoint.get("phase"),
+                        "current_task": latest_checkpoint.get("current_task"),
+                        "total_tasks": latest_checkpoint.get("total_tasks"),
+                        "next_action": latest_checkpoint.get("next_action"),
+                        "branch": latest_checkpoint.get("branch"),
+                        "worktree_path": latest_checkpoint.get("worktree_path"),
+                    }
+                    if latest_checkpoint
+                    else None
+                ),
+            }
 
-    return 0
+            print(json.dumps(recovery_info))
+            return 1
+
+    # General incomplete status (no specific feature in progress)
+    result = {
+        "status": "incomplete",
+        "project_name": project_name,
+        "completed": completed,
+        "total": total,
+        "actionable_count": len(actionable_incomplete),
+        "deferred_count": len(deferred_incomplete),
+        "drift_diagnosis": reconcile_report.get("diagnosis"),
+        "drift_recommended_next_step": reconcile_report.get("recommended_next_step"),
+    }
+
+    if not output_json:
+        print(f"[Progress Tracker] Unfinished project detected: {project_name}")
+        print(f"Progress: {completed}/{total} completed")
+        if reconcile_report.get("diagnosis") != "in_sync":
+            print(
+                "[Progress Tracker] Reality check: "
+                f"{reconcile_report.get('diagnosis')} -> "
+                f"{reconcile_report.get('recommended_next_step')}"
+            )
+        if actionable_incomplete:
+            print("Use '/prog' to view status or '/prog-next' to continue")
+        else:
+            print("Only deferred pending features remain. Use `prog resume --all` to continue.")
+    else:
+        print(json.dumps(result))
+
+    return 1 if actionable_incomplete else 0
 
 
 def determine_recovery_action(
@@ -3228,6 +3272,7 @@ def determine_recovery_action(
     return "manual_review"
 
 
+@_locked_progress_mutation
 def set_current(feature_id):
     """Set the current feature being worked on."""
     is_wrapper = True
@@ -3352,6 +3397,7 @@ def next_feature(output_json: bool = False, ack_planning_risk: bool = False) ->
 next_feature.is_wrapper = True
 
 
+@_locked_progress_mutation
 def set_feature_ai_metrics(
     feature_id: int,
     complexity_score: int,
@@ -3372,9 +3418,8 @@ def set_feature_ai_metrics(
         print(f"Feature ID {feature_id} not found")
         return False
 
-    valid_models = {"haiku", "sonnet", "opus"}
-    if selected_model not in valid_models:
-        print(f"Invalid model '{selected_model}'. Must be one of: {sorted(valid_models)}")
+    if selected_model not in AI_METRICS_MODELS:
+        print(f"Invalid model '{selected_model}'. Must be one of: {list(AI_METRICS_MODELS)}")
         return False
 
     valid_confidences = {"high", "medium", "low"}
@@ -3391,7 +3436,7 @@ def set_feature_ai_metrics(
         print("Invalid complexity score. Must be in range 0-100")
         return False
 
-    now_iso = datetime.now().isoformat() + "Z"
+    now_iso = _iso_now()
     ai_metrics = feature.get("ai_metrics", {})
     if not isinstance(ai_metrics, dict):
         ai_metrics = {}
@@ -3942,6 +3987,7 @@ def cmd_set_sprint_contract(
     return 0
 
 
+@_locked_progress_mutation
 def complete_feature(feature_id, commit_hash=None, skip_archive=False):
     return completion_flow.complete_feature(feature_id, _make_completion_flow_services(), commit_hash=commit_hash, skip_archive=skip_archive)
 complete_feature.is_wrapper = True
@@ -3955,19 +4001,22 @@ def undo_last_feature():
         return False
 
     features = data.get("features", [])
-    completed_features = [f for f in features if f.get("completed", False)]
 
-    if not completed_features:
-        print("No completed features to undo.")
-        return False
-
-    # Sort by completed_at desc, then id desc
+    # Latest by completed_at, then id
     def sort_key(f):
         # Use a default very old date for features without completed_at
         date_str = f.get("completed_at", "1970-01-01T00:00:00Z")
         return (date_str, f.get("id", 0))
 
-    last_feature = sorted(completed_features, key=sort_key, reverse=True)[0]
+    last_feature = max(
+        (f for f in features if f.get("completed", False)),
+        key=sort_key,
+        default=None,
+    )
+    if last_feature is None:
+        print("No completed features to undo.")
+        return False
+
     commit_hash = last_feature.get("commit_hash")
 
     print(
@@ -3985,6 +4034,20 @@ def undo_last_feature():
                 print("Commit hash must be 7-40 hexadecimal characters.")
                 print("To protect your repo, progress undo has been aborted.")
                 return False
+            # Probe through the shared cat-file process instead of letting
+            # `git revert` discover a missing object after the clean check.
+            try:
+                commit_exists = get_git_batch(str(find_project_root())).exists(
+                    f"{commit_hash}^{{commit}}"
+                )
+            except GitCommandError as e:
+                print(f"Error: Could not check commit {commit_hash} with git: {e}")
+                print("To protect your repo, progress undo has been aborted.")
+                return False
+            if not commit_exists:
+                print(f"Error: Commit {commit_hash} not found in this repository.")
+                print("To protect your repo, progress undo has been aborted.")
+                return False
         else:
             # Basic validation fallback
             if not re.match(r'^[0-9a-f]{7,40}$', commit_hash):
@@ -4150,6 +4213,7 @@ def set_feature_owner(feature_id: int, role: str, owner: Optional[str]) -> bool:
 set_feature_owner.is_wrapper = True
 
 
+@_locked_progress_mutation
 def add_feature(name, test_steps, workflow_profile=None):
     import work_item_commands
 
@@ -4162,6 +4226,7 @@ def add_feature(name, test_steps, workflow_profile=None):
 add_feature.is_wrapper = True
 
 
+@_locked_progress_mutation
 def update_feature(feature_id, name, test_steps=None):
     import work_item_commands
 
@@ -4203,57 +4268,40 @@ def resume_deferred_features(defer_group: Optional[str], resume_all: bool) -> bo
 resume_deferred_features.is_wrapper = True
 
 
-def get_next_bug_id():
+def get_next_bug_id(data: Optional[Dict[str, Any]] = None):
     """
-    Generate the next bug ID with retry logic for concurrency safety.
+    Generate the next bug ID as one past the highest existing BUG-XXX.
 
-    Uses a retry mechanism to handle potential race conditions in
-    concurrent scenarios. Falls back to timestamp-based ID if
-    collisions are detected.
+    Callers that write the new bug (``_add_bug_internal``) hold the progress
+    lock across load, ID allocation and save, so the ID cannot collide with a
+    concurrent writer and no retry is needed.
+
+    Args:
+        data: Already-loaded progress data; read from progress.json if omitted.
 
     Returns:
         str: Next bug ID in format BUG-XXX
     """
-    max_retries = 3
-    for attempt in range(max_retries):
+    if data is None:
         data = load_progress_json()
-        if not data:
-            return "BUG-001"
-
-        bugs = data.get("bugs", [])
-        if not bugs:
-            return "BUG-001"
-
-        # Extract numeric part and find max
-        max_id = 0
-        for bug in bugs:
-            bug_id = bug.get("id", "BUG-000")
-            # Extract number from BUG-XXX format
-            try:
-                num = int(bug_id.split("-")[1])
-                max_id = max(max_id, num)
-            except (IndexError, ValueError):
-                logger.warning(f"Invalid bug ID format: {bug_id}")
-                pass
-
-        new_id = f"BUG-{max_id + 1:03d}"
-
-        # Verify ID doesn't exist (race condition check)
-        if not any(b.get("id") == new_id for b in bugs):
-            return new_id
-
-        # Retry if collision detected
-        if attempt < max_retries - 1:
-            logger.warning(f"Bug ID collision detected for {new_id}, retrying...")
-            continue
+    if not data:
+        return "BUG-001"
+
+    # Extract numeric part and find max
+    max_id = 0
+    for bug in data.get("bugs") or []:
+        bug_id = bug.get("id", "BUG-000")
+        # Extract number from BUG-XXX format
+        digits = bug_id[4:] if isinstance(bug_id, str) and bug_id.startswith("BUG-") else ""
+        if digits.isdecimal():
+            max_id = max(max_id, int(digits))
+        else:
+            logger.warning(f"Invalid bug ID format: {bug_id}")
 
-    # Fallback: use timestamp to guarantee uniqueness
-    timestamp_suffix = int(datetime.now().timestamp() % 1000)
-    fallback_id = f"BUG-{timestamp_suffix:03d}"
-    logger.warning(f"Using timestamp-based bug ID: {fallback_id}")
-    return fallback_id
+    return f"BUG-{max_id + 1:03d}"
 
 
+@_locked_progress_mutation
 def _add_bug_internal(
     description: str,
     status: str = "pending_investigation",
@@ -4381,7 +4429,14 @@ def remove_bug(bug_id: str):
         print(f"No bugs found. Bug {bug_id} does not exist.")
         return False
 
-    bug = next((b for b in bugs if b.get("id") == bug_id), None)
+    # One pass: find the bug and build the remaining list together
+    bug = None
+    remaining = []
+    for candidate in bugs:
+        if candidate.get("id") == bug_id:
+            bug = bug or candidate
+        else:
+            remaining.append(candidate)
     if not bug:
         print(f"Bug {bug_id} not found.")
         return False
@@ -4390,7 +4445,7 @@ def remove_bug(bug_id: str):
     print(f"Description: {bug.get('description', 'No description')}")
 
     # Remove bug
-    data["bugs"] = [b for b in bugs if b.get("id") != bug_id]
+    data["bugs"] = remaining
 
     # Clear current bug if this was it
     if data.get("current_bug_id") == bug_id:
@@ -4407,6 +4462,7 @@ def reset_tracking(force=False, remove_active=False):
     """Reset active progress tracking files (thin shim; logic in admin_ops)."""
     import admin_ops
 
+    clear_project_root_cache()
     progress_dir = get_progress_dir()
     tracked_files = [
         progress_dir / PROGRESS_JSON,
@@ -261,8 +261,9 @@ def save_memory(data: Dict[str, Any], path: Optional[Path] = None) -> None:
     temp_path = memory_path.parent / (
         f".{memory_path.name}.tmp.{os.getpid()}.{int(datetime.now(timezone.utc).timestamp())}"
     )
+    payload = json.dumps(normalized, indent=2, ensure_ascii=False)
     with open(temp_path, "w", encoding="utf-8") as handle:
-        json.dump(normalized, handle, indent=2, ensure_ascii=False)
+        handle.write(payload)
     os.replace(temp_path, memory_path)
 
 
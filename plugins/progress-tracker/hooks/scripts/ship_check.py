@@ -18,6 +18,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
 
+import state_io
+
 Status = Literal["pass", "fail"]
 
 
@@ -203,12 +205,12 @@ def _update_progress_json(
     if not progress_json_path.exists():
         return
     try:
-        data = json.loads(progress_json_path.read_text())
+        data = state_io._load_json_bytes(progress_json_path.read_bytes())
         for feat in data.get("features", []):
             if feat.get("id") == feature_id:
                 feat.setdefault("quality_gates", {})["ship_check"] = result.to_quality_gate_payload()
                 break
-        progress_json_path.write_text(json.dumps(data, indent=2))
+        state_io._atomic_write_text(progress_json_path, state_io._dump_json_text(data))
     except Exception:
         pass  # Never block the gate on persistence failure
 
@@ -9,6 +9,11 @@ import tempfile
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional fast codec; stdlib json is the fallback
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Schema constants
 # ---------------------------------------------------------------------------
@@ -24,6 +29,29 @@ CURRENT_SCHEMA_VERSION = "2.1"
 PROGRESS_JSON = "progress.json"
 PROGRESS_MD = "progress.md"
 
+# ---------------------------------------------------------------------------
+# JSON codec (orjson when installed)
+# ---------------------------------------------------------------------------
+
+def _dump_json_text(data: Any) -> str:
+    """Serialize state as 2-space indented UTF-8 JSON text."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; let stdlib handle it
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _load_json_bytes(raw: bytes) -> Any:
+    """Parse JSON bytes (orjson.JSONDecodeError subclasses json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 # ---------------------------------------------------------------------------
 # Atomic file I/O
 # ---------------------------------------------------------------------------
@@ -48,8 +76,9 @@ def _atomic_write_text(path: Path, content: str) -> None:
             handle.flush()
             os.fsync(handle.fileno())
         os.replace(temp_path, path)
+        temp_path = None  # renamed into place; nothing left to clean up
     finally:
-        if temp_path is not None and temp_path.exists():
+        if temp_path is not None:
             try:
                 temp_path.unlink()
             except OSError:
@@ -67,17 +96,19 @@ def load_progress_json(
     """Load the progress.json file from the specified directory."""
     json_path = progress_dir / PROGRESS_JSON
 
-    if not json_path.exists():
+    # Read directly rather than exists()-then-read: one syscall fewer per load
+    try:
+        raw = json_path.read_bytes()
+    except (FileNotFoundError, NotADirectoryError):
         return None
 
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if not isinstance(data, dict):
-                print(f"Error: {json_path} is not a valid JSON object.")
-                return None
-            apply_schema_defaults(data)
-            return data
+        data = _load_json_bytes(raw)
+        if not isinstance(data, dict):
+            print(f"Error: {json_path} is not a valid JSON object.")
+            return None
+        apply_schema_defaults(data)
+        return data
     except json.JSONDecodeError:
         print(f"Error: {json_path} is corrupted.")
         return None
@@ -91,7 +122,6 @@ def save_progress_json(
     now_fn: Optional[Callable[[], str]] = None,
 ) -> None:
     """Save data to progress.json file in progress_dir with optional updated_at touch."""
-    progress_dir.mkdir(parents=True, exist_ok=True)
     json_path = progress_dir / PROGRESS_JSON
 
     if apply_schema_defaults is not None:
@@ -100,7 +130,7 @@ def save_progress_json(
     if touch_updated_at and now_fn is not None:
         data["updated_at"] = now_fn()
 
-    payload = json.dumps(data, indent=2, ensure_ascii=False)
+    payload = _dump_json_text(data)
     _atomic_write_text(json_path, payload)
 
 
@@ -607,8 +637,7 @@ def load_checkpoints_from_file(path: Path) -> Dict[str, Any]:
         }
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _load_json_bytes(path.read_bytes())
     except (json.JSONDecodeError, OSError):
         import logging
         logging.getLogger("progress_tracker.state_io").warning(
@@ -437,6 +437,25 @@ def status(
     summary_risk = summary.get("risk_blocker", {})
     summary_snapshot = summary.get("recent_snapshot", {})
 
+    # Partition features in one pass; every section below reuses these lists.
+    completed_features: List[Dict[str, Any]] = []
+    current_features: List[Dict[str, Any]] = []
+    deferred: List[Dict[str, Any]] = []
+    remaining: List[Dict[str, Any]] = []
+    for f in features:
+        if not isinstance(f, dict):
+            continue
+        is_current = f.get("id") == current_id
+        if is_current:
+            current_features.append(f)
+        if f.get("completed", False):
+            completed_features.append(f)
+        elif not is_current:
+            if worktree_handler._is_feature_deferred(f):
+                deferred.append(f)
+            else:
+                remaining.append(f)
+
     # Calculate statistics
     total = summary_progress.get("total")
     completed = summary_progress.get("completed")
@@ -444,20 +463,11 @@ def status(
     if not isinstance(total, int):
         total = len(features)
     if not isinstance(completed, int):
-        completed = sum(
-            1 for f in features if isinstance(f, dict) and f.get("completed", False)
-        )
+        completed = len(completed_features)
     if not isinstance(percentage, int):
         percentage = completed * 100 // total if total > 0 else 0
     in_progress = current_id is not None
-    deferred_count = sum(
-        1
-        for f in features
-        if isinstance(f, dict)
-        and not f.get("completed", False)
-        and f.get("id") != current_id
-        and worktree_handler._is_feature_deferred(f)
-    )
+    deferred_count = len(deferred)
 
     print(f"\n## Project: {project_name}")
     print(f"**Status**: {completed}/{total} completed ({percentage}%)")
@@ -479,7 +489,7 @@ def status(
         print(f"**Deferred Pending**: {deferred_count}")
 
     if current_id is not None:
-        current_feature = next((f for f in features if f.get("id") == current_id), None)
+        current_feature = current_features[0] if current_features else None
         if current_feature:
             print(
                 f"**Current Feature**: {current_feature.get('name', 'Unknown')} (in progress)"
@@ -534,43 +544,25 @@ def status(
     # Display features
     if completed > 0:
         print("\n### Completed:")
-        for f in features:
-            if f.get("completed", False):
-                print(f"  [x] {f.get('name', 'Unknown')}")
-                owner_summary = doc_generator._format_feature_owners(f)
-                if owner_summary:
-                    print(f"     Owners: {owner_summary}")
+        for f in completed_features:
+            print(f"  [x] {f.get('name', 'Unknown')}")
+            owner_summary = doc_generator._format_feature_owners(f)
+            if owner_summary:
+                print(f"     Owners: {owner_summary}")
 
     if in_progress:
         print("\n### In Progress:")
-        for f in features:
-            if f.get("id") == current_id:
-                print(f"  [*] {f.get('name', 'Unknown')}")
-                owner_summary = doc_generator._format_feature_owners(f)
-                if owner_summary:
-                    print(f"     Owners: {owner_summary}")
-                test_steps = f.get("test_steps", [])
-                if test_steps:
-                    print("     Test steps:")
-                    for step in test_steps:
-                        print(f"       - {step}")
-
-    deferred = [
-        f
-        for f in features
-        if isinstance(f, dict)
-        and not f.get("completed", False)
-        and f.get("id") != current_id
-        and worktree_handler._is_feature_deferred(f)
-    ]
-    remaining = [
-        f
-        for f in features
-        if isinstance(f, dict)
-        and not f.get("completed", False)
-        and f.get("id") != current_id
-        and not worktree_handler._is_feature_deferred(f)
-    ]
+        for f in current_features:
+            print(f"  [*] {f.get('name', 'Unknown')}")
+            owner_summary = doc_generator._format_feature_owners(f)
+            if owner_summary:
+                print(f"     Owners: {owner_summary}")
+            test_steps = f.get("test_steps", [])
+            if test_steps:
+                print("     Test steps:")
+                for step in test_steps:
+                    print(f"       - {step}")
+
     if remaining:
         print("\n### Pending:")
         for f in remaining:
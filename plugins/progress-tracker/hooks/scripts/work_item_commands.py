@@ -11,7 +11,7 @@ from __future__ import annotations
 import json
 import re
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
@@ -51,6 +51,7 @@ UPDATE_SOURCES = (
     "manual",
 )
 UPDATE_REFS_INLINE_LIMIT = 12
+TASK_PRIORITIES = ("P0", "P1", "P2")
 _SMART_INTAKE_PRIORITY_MAP = {"P0": "high", "P1": "medium", "P2": "low"}
 
 
@@ -69,8 +70,8 @@ class WorkItemCommandsServices:
 
 
 def _iso_now() -> str:
-    """Return current local timestamp with trailing Z for compatibility."""
-    return datetime.now().isoformat() + "Z"
+    """Return current UTC timestamp in ISO 8601 format with Z suffix."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
 def _persist_progress(data: Dict[str, Any], svc: WorkItemCommandsServices) -> None:
@@ -410,7 +411,7 @@ def add_feature_command(
         return False
 
     features = data.get("features", [])
-    max_id = max([f.get("id", 0) for f in features], default=0)
+    max_id = max((f.get("id", 0) for f in features), default=0)
     new_id = max_id + 1
 
     new_feature = {
@@ -627,10 +628,9 @@ def add_task_item_command(
     if len(description) > 2000:
         raise ValueError(f"Description too long ({len(description)} chars, max 2000)")
 
-    valid_priorities = ["P0", "P1", "P2"]
-    if priority not in valid_priorities:
+    if priority not in TASK_PRIORITIES:
         raise ValueError(
-            f"Invalid priority '{priority}'. Must be one of: {valid_priorities}"
+            f"Invalid priority '{priority}'. Must be one of: {list(TASK_PRIORITIES)}"
         )
 
     if workflow_profile not in WORKFLOW_PROFILE_VALUES:
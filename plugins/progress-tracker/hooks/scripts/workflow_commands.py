@@ -12,7 +12,7 @@ import json
 import logging
 import time
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
@@ -80,8 +80,8 @@ class WorkflowCommandsServices:
 
 
 def _iso_now() -> str:
-    """Return current local timestamp with trailing Z for compatibility."""
-    return datetime.now().isoformat() + "Z"
+    """Return current UTC timestamp in ISO 8601 format with Z suffix."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
 def _persist_progress(data: Dict[str, Any], svc: WorkflowCommandsServices) -> None:
@@ -737,12 +737,12 @@ def health_check_command(*, svc: WorkflowCommandsServices):
     Output:
         JSON with status, response_time_ms, and recommended_timeout
     """
-    start = time.time()
+    start = time.monotonic()
 
     # Load progress to check data integrity
     try:
         data = svc.load_progress_json_fn()
-        load_time = time.time() - start
+        load_time = time.monotonic() - start
 
         if data:
             features = data.get("features", [])
@@ -758,10 +758,10 @@ def health_check_command(*, svc: WorkflowCommandsServices):
         data_valid = False
         features = []
         bugs = []
-        load_time = time.time() - start
+        load_time = time.monotonic() - start
 
     # Check git connectivity
-    git_start = time.time()
+    git_start = time.monotonic()
     try:
         if GIT_VALIDATOR_AVAILABLE:
             git_healthy = is_git_repository()
@@ -772,12 +772,12 @@ def health_check_command(*, svc: WorkflowCommandsServices):
                 timeout=2
             ) if GIT_VALIDATOR_AVAILABLE else (0, "", "")
             git_healthy = exit_code in (0, 128)  # 0=success, 128=not in repo
-        git_time = time.time() - git_start
+        git_time = time.monotonic() - git_start
     except Exception:
         git_healthy = False
-        git_time = time.time() - git_start
+        git_time = time.monotonic() - git_start
 
-    total = time.time() - start
+    total = time.monotonic() - start
 
     # Calculate recommended timeout (3x current response time, minimum 10 seconds)
     recommended_timeout = max(10, int(total * 3))
@@ -7,10 +7,11 @@ import json
 import sys
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import git_utils
-from git_utils import _run_git
+import state_io
+from git_utils import _parse_worktree_list_output, _run_git
 
 PROGRESS_JSON = "progress.json"
 
@@ -20,32 +21,6 @@ def _is_feature_deferred(feature: Dict[str, Any]) -> bool:
     return bool(feature.get("deferred", False))
 
 
-def _parse_worktree_list_output(output: str) -> List[Dict[str, str]]:
-    """Parse `git worktree list --porcelain` output."""
-    entries: List[Dict[str, str]] = []
-    current: Dict[str, str] = {}
-
-    for line in output.splitlines():
-        if not line.strip():
-            if current:
-                entries.append(current)
-                current = {}
-            continue
-
-        if " " not in line:
-            continue
-
-        parts = line.split(None, 1)
-        if len(parts) == 2:
-            key, val = parts[0], parts[1].strip()
-            current[key] = val
-
-    if current:
-        entries.append(current)
-
-    return entries
-
-
 def _extract_branch_name_from_worktree_ref(ref: Optional[str]) -> Optional[str]:
     """Normalize a worktree porcelain branch ref to a branch name."""
     if not isinstance(ref, str):
@@ -156,8 +131,7 @@ def _find_existing_worktree_candidates_for_feature(
             continue
 
         try:
-            with open(progress_file, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
+            data = state_io._load_json_bytes(progress_file.read_bytes())
         except (OSError, json.JSONDecodeError):
             continue
 
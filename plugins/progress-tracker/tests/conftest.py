@@ -26,6 +26,7 @@ def reset_progress_tracker_module_state():
     progress_manager._PROJECT_ROOT_OVERRIDE = None
     progress_manager._REPO_ROOT = None
     progress_manager._STORAGE_READY_ROOT = None
+    progress_manager.clear_project_root_cache()
 
     try:
         import project_memory  # type: ignore
@@ -41,6 +42,7 @@ def reset_progress_tracker_module_state():
     progress_manager._PROJECT_ROOT_OVERRIDE = None
     progress_manager._REPO_ROOT = None
     progress_manager._STORAGE_READY_ROOT = None
+    progress_manager.clear_project_root_cache()
 
     try:
         import project_memory  # type: ignore
@@ -10,7 +10,7 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from unittest.mock import MagicMock, patch
 
 # Ensure hooks/scripts is on sys.path (same as conftest.py)
@@ -160,6 +160,30 @@ def test_save_archive_record_writes_archive_info():
     assert archive_info.get("files_moved") == 2, "files_moved should match archived_files length"
 
 
+def test_save_archive_record_reuses_caller_data():
+    """save_archive_record writes into caller-supplied data without reloading."""
+    data = {"current_feature_id": 1, "features": [_base_feature(1)], "workflow_state": {}}
+    saved: List[dict] = []
+
+    def fail_load() -> dict:
+        raise AssertionError("progress.json must not be reloaded")
+
+    services = _noop_services(
+        load_progress_json_fn=fail_load,
+        save_progress_json_fn=saved.append,
+    )
+
+    save_archive_record(
+        feature_id=1,
+        archive_result={"archived_files": ["docs/a.md"], "success": True, "errors": []},
+        services=services,
+        data=data,
+    )
+
+    assert saved == [data]
+    assert data["features"][0]["archive_info"]["files_moved"] == 1
+
+
 # ─────────────────────────── Test 3 ───────────────────────────────────────────
 
 def test_run_acceptance_tests_passes_for_vacuous_feature():
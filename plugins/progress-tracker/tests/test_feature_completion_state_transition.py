@@ -7,7 +7,7 @@ from planning → developing → completed.
 """
 
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pytest
 
@@ -89,11 +89,11 @@ class TestFeatureCompletionStateTransition:
 
     def test_complete_feature_records_completed_at_timestamp(self, feature_in_planning):
         """Feature completion should record completed_at timestamp."""
-        before_complete = datetime.now().isoformat()
+        before_complete = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
         progress_manager.complete_feature(1, commit_hash="abc123")
 
-        after_complete = datetime.now().isoformat()
+        after_complete = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
         data = progress_manager.load_progress_json()
         feature = data["features"][0]
@@ -27,6 +27,29 @@ def test_extract_source_block_missing_markers() -> None:
         generate_prog_docs.extract_source_block("no markers here", "README_EN")
 
 
+def test_extract_source_block_end_before_start() -> None:
+    source = "<!-- SOURCE:README_EN:END -->\n<!-- SOURCE:README_EN:START -->\nline\n"
+    with pytest.raises(ValueError):
+        generate_prog_docs.extract_source_block(source, "README_EN")
+
+
+def test_target_differs_detects_size_and_content(tmp_path: Path) -> None:
+    target = tmp_path / "PROG_HELP.md"
+    assert generate_prog_docs.target_differs(target, "abc\n") is True
+
+    target.write_text("abc\n", encoding="utf-8")
+    assert generate_prog_docs.target_differs(target, "abc\n") is False
+    assert generate_prog_docs.target_differs(target, "abcd\n") is True
+    assert generate_prog_docs.target_differs(target, "abd\n") is True
+
+
+def test_target_differs_ignores_crlf_newlines(tmp_path: Path) -> None:
+    target = tmp_path / "PROG_HELP.md"
+    target.write_bytes(b"line one\r\nline two\r\n")
+    assert generate_prog_docs.target_differs(target, "line one\nline two\n") is False
+    assert generate_prog_docs.target_differs(target, "line one\nline 2\n") is True
+
+
 def test_replace_generated_block_success() -> None:
     content = """
 Header
@@ -102,6 +102,24 @@ class TestGitRevert:
         # Should still update progress even if revert fails
         assert result is False  # Current implementation fails on git error
 
+    def test_undo_reports_git_failure_instead_of_missing_commit(
+        self, mock_git_repo, progress_file, capsys
+    ):
+        """A commit probe that cannot run git must not be reported as a missing commit."""
+        data = progress_manager.load_progress_json()
+        data["features"][0]["commit_hash"] = "abc1234"
+        progress_manager.save_progress_json(data)
+
+        batch = MagicMock()
+        batch.exists.side_effect = progress_manager.GitCommandError("git cat-file exited")
+        with patch.object(progress_manager, "get_git_batch", return_value=batch):
+            result = progress_manager.undo_last_feature()
+
+        captured = capsys.readouterr()
+        assert result is False
+        assert "Could not check commit abc1234" in captured.out
+        assert "not found in this repository" not in captured.out
+
 
 class TestGitDetection:
     """Test git repository detection."""
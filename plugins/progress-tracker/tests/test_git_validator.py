@@ -20,7 +20,10 @@ from git_validator import (
     is_git_repository,
     get_git_root,
     is_working_directory_clean,
-    get_current_commit_hash
+    get_current_commit_hash,
+    get_git_info,
+    GitBatch,
+    get_git_batch,
 )
 
 
@@ -144,6 +147,25 @@ class TestSafeGitCommand:
             # Note: This might not always timeout depending on system speed
             safe_git_command(['git', 'status'], timeout=0.0001)
 
+    def test_spawns_resolved_git_executable(self):
+        """Should exec the git binary resolved once from PATH."""
+        import shutil
+        from unittest.mock import MagicMock, patch
+        import git_validator
+
+        mock_run = MagicMock()
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        with patch.object(git_validator, "_GIT_EXECUTABLE", None), \
+             patch.object(git_validator.subprocess, "run", mock_run):
+            safe_git_command(['git', 'status', '--porcelain'])
+            safe_git_command(['rev-parse', 'HEAD'])
+
+        first_cmd = mock_run.call_args_list[0].args[0]
+        second_cmd = mock_run.call_args_list[1].args[0]
+        expected = shutil.which('git') or 'git'
+        assert first_cmd == [expected, 'status', '--porcelain']
+        assert second_cmd == [expected, 'rev-parse', 'HEAD']
+
 
 class TestHelperFunctions:
     """Test helper functions in git_validator."""
@@ -171,6 +193,80 @@ class TestHelperFunctions:
         if result:
             assert len(result) == 40  # Full hash
 
+    def test_get_git_info_unborn_head(self, tmp_path):
+        """Fresh repository should report root but no HEAD commit."""
+        import subprocess
+        subprocess.run(['git', 'init', '-q', str(tmp_path)], check=True)
+        info = get_git_info(str(tmp_path))
+        assert info["is_repository"] is True
+        assert info["is_inside_work_tree"] is True
+        assert os.path.realpath(info["root"]) == os.path.realpath(str(tmp_path))
+        assert info["head"] is None
+
+    def test_get_git_info_outside_repository(self, tmp_path):
+        """Non-repository directory should report nothing."""
+        info = get_git_info(str(tmp_path))
+        assert info == {
+            "is_repository": False,
+            "is_inside_work_tree": False,
+            "root": None,
+            "head": None,
+        }
+
+
+class TestGitBatch:
+    """Test the persistent cat-file probe process."""
+
+    def test_resolves_many_refs_with_one_process(self, mock_git_repo):
+        """Should answer repeated probes over a single git process."""
+        with GitBatch(str(mock_git_repo)) as batch:
+            head = batch.resolve('HEAD')
+            assert head is not None
+            assert head[1] == 'commit'
+            assert validate_commit_hash(head[0])
+            pid = batch._proc.pid
+
+            assert batch.exists(f"{head[0]}^{{commit}}") is True
+            assert batch.exists('refs/heads/does-not-exist') is False
+            assert batch.exists('HEAD:README.md') is True
+            assert batch._proc.pid == pid
+
+        assert batch._proc is None
+
+    def test_rejects_multiline_refs(self, mock_git_repo):
+        """Should refuse refs that would desynchronize the line protocol."""
+        with GitBatch(str(mock_git_repo)) as batch:
+            assert batch.exists('HEAD\nHEAD') is False
+            assert batch.exists('') is False
+            assert batch._proc is None
+
+    def test_outside_repository(self, tmp_path):
+        """Should raise instead of reporting a missing object when git cannot run."""
+        with GitBatch(str(tmp_path)) as batch:
+            with pytest.raises(GitCommandError):
+                batch.exists('HEAD')
+            assert batch._proc is None
+
+    def test_unanswered_probe_times_out(self, tmp_path):
+        """Should kill a child that never replies and raise a timeout error."""
+        import subprocess
+
+        with GitBatch(str(tmp_path), timeout=0.2) as batch:
+            batch._proc = subprocess.Popen(
+                [sys.executable, '-c', 'import time; time.sleep(30)'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+            )
+            with pytest.raises(GitCommandError, match="timed out"):
+                batch.resolve('HEAD')
+            assert batch._proc is None
+
+    def test_get_git_batch_shared_per_cwd(self, tmp_path):
+        """Should hand out one shared instance per working directory."""
+        assert get_git_batch(str(tmp_path)) is get_git_batch(str(tmp_path))
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
@@ -49,7 +49,9 @@ def test_resolve_main_repo_path_with_worktree():
     def mock_run_impl(cmd, **kwargs):
         if "rev-parse" in cmd and "--show-toplevel" in cmd:
             m = MagicMock()
+            m.returncode = 0
             m.stdout = str(wt_root) + "\n"
+            m.stderr = ""
             return m
         raise ValueError("Unexpected command")
 
@@ -555,6 +555,16 @@ class TestComplexityAnalyzer:
         # Expired entry should have been filtered out
         assert stats['entries'] == 0
 
+    def test_cache_dir_created_on_first_save(self):
+        """Constructing an analyzer should not touch the filesystem."""
+        cache_dir = self.cache_dir / "nested" / "cache"
+        analyzer = self.ComplexityAnalyzer(cache_dir=cache_dir)
+        assert not cache_dir.exists()
+
+        analyzer.analyze_complexity("Lazy cache dir", ["step1"], use_cache=True)
+
+        assert (cache_dir / "complexity_cache.json").exists()
+
 
 class TestHealthCheck:
     """Test health check functionality."""
@@ -189,6 +189,17 @@ class TestSemanticEntryPoints:
         assert result.record.to_state == "verified"
         assert result.record.after_snapshot.get("commit_hash") == "abc123"
 
+    def test_save_progress_json_replaces_atomically(self, setup_progress):
+        """_save_progress_json 应通过临时文件替换，不留下 .tmp 文件"""
+        data = lifecycle_state_machine.load_progress_json(str(setup_progress))
+        data["project_name"] = "原子写入"
+        lifecycle_state_machine._save_progress_json(data, str(setup_progress))
+
+        state_dir = setup_progress / "docs" / "progress-tracker" / "state"
+        assert not list(state_dir.glob("*.tmp"))
+        reloaded = lifecycle_state_machine.load_progress_json(str(setup_progress))
+        assert reloaded["project_name"] == "原子写入"
+
     def test_archive_feature_verified_to_archived(self, setup_progress):
         """archive_feature 应转换 verified → archived"""
         # 先设置为 verified
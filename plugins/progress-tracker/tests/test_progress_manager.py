@@ -48,6 +48,46 @@ class TestProjectRootDetection:
         root = progress_manager.find_project_root()
         assert root == temp_dir
 
+    def test_find_project_root_memoized_per_cwd(self, temp_dir):
+        """Repeated lookups in the same cwd should probe git only once."""
+        import prog_paths
+
+        calls = []
+        real_git_root = prog_paths._git_root
+
+        def counting_git_root(cwd):
+            calls.append(cwd)
+            return real_git_root(cwd)
+
+        with patch.object(prog_paths, "_git_root", side_effect=counting_git_root):
+            assert progress_manager.find_project_root() == temp_dir
+            assert progress_manager.find_project_root() == temp_dir
+            assert len(calls) == 1
+
+            progress_manager.clear_project_root_cache()
+            assert progress_manager.find_project_root() == temp_dir
+            assert len(calls) == 2
+
+    def test_git_root_found_by_dotgit_walk_without_subprocess(self, temp_dir, monkeypatch):
+        """Plain .git dirs and worktree .git files should resolve without forking git."""
+        import prog_paths
+
+        for name in ("GIT_DIR", "GIT_WORK_TREE", "GIT_CEILING_DIRECTORIES"):
+            monkeypatch.delenv(name, raising=False)
+        repo = temp_dir / "repo"
+        (repo / ".git").mkdir(parents=True)
+        (repo / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        worktree = repo / "nested" / "wt"
+        worktree.mkdir(parents=True)
+        (worktree / ".git").write_text("gitdir: /elsewhere\n")
+        stale = repo / "pkg"
+        (stale / ".git").mkdir(parents=True)
+        (stale / "src").mkdir()
+
+        with patch("prog_paths.subprocess.run", side_effect=AssertionError("forked git")):
+            assert prog_paths._git_root(stale / "src") == repo
+            assert prog_paths._git_root(worktree) == worktree
+
     def test_configure_project_scope_accepts_explicit_project_root(self, temp_dir):
         """Should accept explicit --project-root in monorepo root."""
         os.system(f"git -C {temp_dir} init >/dev/null 2>&1")
@@ -215,6 +255,31 @@ class TestTransactionAndLocking:
         summaries = [update.get("summary") for update in data.get("updates", [])]
         assert "blocked until lock release" in summaries
 
+    @pytest.mark.skipif(fcntl is None, reason="fcntl lock tests require POSIX")
+    def test_direct_api_mutation_holds_progress_lock(self, temp_dir):
+        """Direct API mutators should hold the progress lock across load/save."""
+        os.chdir(temp_dir)
+        assert progress_manager.init_tracking("API Lock", force=True) is True
+        lock_path = temp_dir / "docs" / "progress-tracker" / "state" / "progress.lock"
+        observed = []
+
+        def probe_lock(*args, **kwargs):
+            with open(lock_path, "a+", encoding="utf-8") as probe:
+                try:
+                    fcntl.flock(probe.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    fcntl.flock(probe.fileno(), fcntl.LOCK_UN)
+                    observed.append("free")
+                except BlockingIOError:
+                    observed.append("held")
+            return real_load(*args, **kwargs)
+
+        real_load = progress_manager.load_progress_json
+        with patch.object(progress_manager, "load_progress_json", side_effect=probe_lock):
+            assert progress_manager.add_feature("Locked Feature", ["step"]) is True
+            assert progress_manager.add_bug("Locked bug") is True
+
+        assert observed and set(observed) == {"held"}
+
     def test_concurrent_add_update_commands_preserve_all_updates(self, temp_dir):
         """Concurrent add-update commands should not lose updates under transaction lock."""
         os.chdir(temp_dir)
@@ -1335,6 +1400,16 @@ class TestPluginRoot:
         """Should reject invalid plugin root."""
         assert progress_manager.validate_plugin_root(temp_dir) is False
 
+    def test_validate_plugin_root_hooks_json_needs_skills_or_commands(self, temp_dir):
+        """hooks.json alone is not enough; skills/ or commands/ must exist too."""
+        (temp_dir / "hooks").mkdir()
+        (temp_dir / "hooks" / "hooks.json").write_text("{}")
+        assert progress_manager.validate_plugin_root(temp_dir) is False
+
+        (temp_dir / "commands").mkdir()
+        assert progress_manager.validate_plugin_root(temp_dir) is True
+        assert progress_manager.validate_plugin_root(temp_dir / "missing") is False
+
 
 class TestProgressMdFile:
     """Test deprecated progress.md file operations."""
@@ -1371,6 +1446,21 @@ class TestCheckCommand:
         result = progress_manager.check()
         assert result == 0
 
+    def test_check_all_complete_skips_git_probes(self, temp_dir):
+        """All-complete projects should exit before drift analysis and worktree scan."""
+        progress_manager.init_tracking("Test", force=True)
+        progress_manager.add_feature("F1", ["Step 1"])
+        data = progress_manager.load_progress_json()
+        data["features"][0]["completed"] = True
+        progress_manager.save_progress_json(data)
+
+        with patch("progress_manager.analyze_reconcile_state") as reconcile_mock, \
+             patch("progress_manager._check_other_worktrees_for_incomplete_work") as worktrees_mock:
+            assert progress_manager.check() == 0
+
+        reconcile_mock.assert_not_called()
+        worktrees_mock.assert_not_called()
+
     def test_check_deferred_only_is_non_blocking(self, progress_file, capsys):
         """Should return 0 when only deferred pending features remain."""
         data = progress_manager.load_progress_json()
@@ -1521,6 +1611,30 @@ class TestGitSyncPreflight:
         assert "no_upstream" in issue_ids
         assert report["status"] in ["warning", "critical"]
 
+    def test_analyze_git_sync_warns_when_upstream_is_gone(self, mock_git_repo, tmp_path_factory):
+        """A configured upstream whose remote branch was deleted is not 'in sync'."""
+        remote = tmp_path_factory.mktemp("remote") / "origin.git"
+        subprocess.run(["git", "init", "--bare", str(remote)], capture_output=True, check=True)
+        branch = subprocess.run(
+            ["git", "branch", "--show-current"],
+            cwd=mock_git_repo,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        for args in (
+            ["remote", "add", "origin", str(remote)],
+            ["push", "-u", "origin", branch],
+            # What `git fetch --prune` leaves behind once the remote branch is deleted
+            ["update-ref", "-d", f"refs/remotes/origin/{branch}"],
+        ):
+            subprocess.run(["git", *args], cwd=mock_git_repo, capture_output=True, check=True)
+
+        report = progress_manager.analyze_git_sync_risks()
+        issue_ids = {issue["id"] for issue in report["issues"]}
+
+        assert "no_upstream" in issue_ids
+        assert report["upstream"] is None
+
     def test_analyze_git_sync_detects_in_progress_operation(self, mock_git_repo):
         """Should detect active rebase/merge marker files as critical."""
         rebase_dir = mock_git_repo / ".git" / "rebase-merge"
@@ -1532,6 +1646,186 @@ class TestGitSyncPreflight:
         assert "operation_in_progress" in issue_ids
         assert report["status"] == "critical"
 
+    def test_analyze_git_sync_detects_dirty_worktree(self, mock_git_repo):
+        """Untracked files should surface as a dirty worktree warning."""
+        (mock_git_repo / "scratch.txt").write_text("wip")
+
+        report = progress_manager.analyze_git_sync_risks()
+        issue_ids = {issue["id"] for issue in report["issues"]}
+
+        assert "dirty_worktree" in issue_ids
+        assert report["branch"]
+
+    def test_analyze_git_sync_flags_branch_in_other_worktree_only(self, mock_git_repo, tmp_path_factory):
+        """Only the other worktree on the same branch should be reported."""
+        other = tmp_path_factory.mktemp("wt") / "other"
+        branch = subprocess.run(
+            ["git", "branch", "--show-current"],
+            cwd=mock_git_repo,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        subprocess.run(
+            ["git", "worktree", "add", "-f", str(other), branch],
+            cwd=mock_git_repo,
+            capture_output=True,
+            check=True,
+        )
+
+        report = progress_manager.analyze_git_sync_risks()
+        issues = {issue["id"]: issue for issue in report["issues"]}
+
+        assert "branch_checked_out_elsewhere" in issues
+        message = issues["branch_checked_out_elsewhere"]["message"]
+        assert "other" in message
+        assert str(mock_git_repo.resolve()) not in message
+
+    def test_parse_status_v2_headers_and_entries(self):
+        """Should read branch/upstream headers and flag entry lines as dirty."""
+        import git_utils
+
+        parsed = git_utils._parse_status_v2(
+            "# branch.oid 0123abc\n"
+            "# branch.head feature/x\n"
+            "# branch.upstream origin/feature/x\n"
+            "? notes.txt\n"
+        )
+        assert parsed == {
+            "branch": "feature/x",
+            "upstream": "origin/feature/x",
+            "ahead": None,
+            "behind": None,
+            "is_clean": False,
+        }
+
+        detached = git_utils._parse_status_v2("# branch.oid 0123abc\n# branch.head (detached)\n")
+        assert detached == {
+            "branch": None,
+            "upstream": None,
+            "ahead": None,
+            "behind": None,
+            "is_clean": True,
+        }
+
+    def test_git_sync_check_reuses_fresh_cached_report(self, mock_git_repo):
+        """A second hook run inside the TTL should not re-probe git."""
+        import git_utils
+
+        (mock_git_repo / "docs" / "progress-tracker").mkdir(parents=True)
+        (mock_git_repo / "scratch.txt").write_text("wip")
+        project_root = progress_manager.find_project_root()
+
+        assert progress_manager.git_sync_check() is True
+        cache_path = git_utils._get_git_sync_cache_path(project_root)
+        assert cache_path.parent == (mock_git_repo / ".git").resolve()
+        assert json.loads(cache_path.read_text())["status"] == "warning"
+
+        with patch("git_utils._run_git", side_effect=AssertionError("git probed")):
+            assert progress_manager.git_sync_check() is True
+
+        os.utime(cache_path, (0, 0))
+        with patch("git_utils.analyze_git_sync_risks", return_value={"status": "ok"}) as analyze:
+            assert progress_manager.git_sync_check() is True
+        analyze.assert_called_once()
+
+    def test_git_sync_cache_does_not_dirty_worktree(self, mock_git_repo):
+        """The cached report must not surface as an untracked file on the next probe."""
+        import git_utils
+
+        (mock_git_repo / "docs" / "progress-tracker").mkdir(parents=True)
+        project_root = progress_manager.find_project_root()
+
+        assert progress_manager.git_sync_check() is True
+        status = subprocess.run(
+            ["git", "status", "--porcelain"],
+            cwd=mock_git_repo,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert status.stdout == ""
+
+        os.utime(git_utils._get_git_sync_cache_path(project_root), (0, 0))
+        report = git_utils.analyze_git_sync_risks(project_root)
+        assert "dirty_worktree" not in {issue["id"] for issue in report["issues"]}
+
+    def test_resolve_git_dir_follows_worktree_gitdir_file(self, temp_dir, monkeypatch):
+        """Linked worktrees keep their git dir behind a `gitdir:` pointer file."""
+        import git_utils
+
+        for name in ("GIT_DIR", "GIT_WORK_TREE", "GIT_CEILING_DIRECTORIES"):
+            monkeypatch.delenv(name, raising=False)
+        worktree = temp_dir / "wt"
+        (worktree / "sub").mkdir(parents=True)
+        (worktree / ".git").write_text("gitdir: ../main/.git/worktrees/wt\n")
+
+        with patch("git_utils._run_git", side_effect=AssertionError("git probed")):
+            git_dir = git_utils._resolve_git_dir(worktree / "sub")
+
+        assert git_dir == worktree.resolve() / "../main/.git/worktrees/wt"
+
+    def test_resolve_git_dir_agrees_with_repo_root_on_pointerless_git_file(
+        self, temp_dir, monkeypatch
+    ):
+        """A .git file without `gitdir:` ends the walk for both root and git dir."""
+        import git_utils
+        import prog_paths
+
+        for name in ("GIT_DIR", "GIT_WORK_TREE", "GIT_CEILING_DIRECTORIES"):
+            monkeypatch.delenv(name, raising=False)
+        outer = temp_dir / "outer"
+        (outer / ".git").mkdir(parents=True)
+        (outer / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        inner = outer / "inner"
+        (inner / "sub").mkdir(parents=True)
+        (inner / ".git").write_text("not a pointer\n")
+
+        probed = []
+
+        def fake_run_git(args, cwd=None, **_kwargs):
+            probed.append(cwd)
+            return 128, "", "fatal: invalid gitfile format"
+
+        with patch("git_utils._run_git", side_effect=fake_run_git):
+            git_dir = git_utils._resolve_git_dir(inner / "sub")
+
+        assert prog_paths._find_dotgit((inner / "sub").resolve()) == (inner.resolve(), None)
+        assert prog_paths._git_root(inner / "sub") == inner.resolve()
+        assert git_dir is None
+        assert probed == [str(inner / "sub")]
+
+    def test_parse_worktree_list_output_blocks(self):
+        """Should return one entry per blank-line separated porcelain block."""
+        entries = progress_manager._parse_worktree_list_output(
+            "worktree /repo\n"
+            "HEAD 0123abc\n"
+            "branch refs/heads/main\n"
+            "\n"
+            "worktree /tmp/with space\n"
+            "HEAD 4567def\n"
+            "detached\n"
+            "\n"
+        )
+        assert entries == [
+            {"worktree": "/repo", "HEAD": "0123abc", "branch": "refs/heads/main"},
+            {"worktree": "/tmp/with space", "HEAD": "4567def"},
+        ]
+        assert progress_manager._parse_worktree_list_output("") == []
+
+    def test_parse_status_v2_nul_separated_ahead_behind(self):
+        """Should read ahead/behind counts from -z output without rev-list."""
+        import git_utils
+
+        parsed = git_utils._parse_status_v2(
+            "# branch.oid 0123abc\0"
+            "# branch.head main\0"
+            "# branch.upstream origin/main\0"
+            "# branch.ab +2 -3\0"
+        )
+        assert parsed["ahead"] == 2
+        assert parsed["behind"] == 3
+        assert parsed["is_clean"] is True
+
     def test_git_auto_preflight_requires_worktree_on_default_branch(self):
         """Should require worktree for default branch feature work in-place."""
         fake_context = {
@@ -1743,6 +2037,24 @@ class TestCompleteFeature:
         result = progress_manager.complete_feature(999)
         assert result is False
 
+    def test_archive_feature_docs_matches_legacy_patterns(self, temp_dir, progress_file):
+        """Should move feature/bug docs and create only the archive dirs it uses."""
+        testing_dir = temp_dir / "docs" / "testing"
+        testing_dir.mkdir(parents=True)
+        (testing_dir / "feature-1-notes.md").write_text("notes")
+        (testing_dir / "bug-001-fix-report.md").write_text("report")
+        (testing_dir / "feature-10-notes.md").write_text("other feature")
+
+        result = progress_manager.archive_feature_docs(1)
+
+        archived = sorted(item["to"] for item in result["archived_files"])
+        assert archived == [
+            "docs/archive/testing/bug-001-fix-report.md",
+            "docs/archive/testing/feature-1-notes.md",
+        ]
+        assert (testing_dir / "feature-10-notes.md").exists()
+        assert not (temp_dir / "docs" / "archive" / "plans").exists()
+
 
 class TestAddFeature:
     """Test add feature edge cases."""
@@ -1967,6 +2279,90 @@ class TestWorkflowStateEdgeCases:
         assert result["profile"] == "invalid"
         assert "tasks" in result["missing_sections"]
 
+    def test_validate_plan_document_finds_sections_across_scan_chunks(self, temp_dir):
+        """Should find headings that straddle or follow the first read chunk."""
+        import doc_generator
+
+        plans_dir = Path("docs/plans")
+        plans_dir.mkdir(parents=True, exist_ok=True)
+        filler = "x" * (doc_generator.PLAN_SCAN_CHUNK_CHARS - 5) + "\n"
+        (plans_dir / "long-plan.md").write_text(
+            filler + "## Tasks\n- Task 1\n"
+            + ("- detail\n" * 2000)
+            + "## Acceptance Mapping\n- ok\n"
+            + "## Risks\n- none\n",
+            encoding="utf-8",
+        )
+
+        result = progress_manager.validate_plan_document("docs/plans/long-plan.md")
+
+        assert result["valid"] is True
+        assert result["profile"] == "strict"
+
+    def test_validate_plan_document_ignores_heading_text_mid_line(self, temp_dir):
+        """Carried chunk tails must not turn mid-line text into a heading."""
+        import doc_generator
+
+        plans_dir = Path("docs/plans")
+        plans_dir.mkdir(parents=True, exist_ok=True)
+        line = "y" * (doc_generator.PLAN_SCAN_CHUNK_CHARS - 10) + "## Tasks\n"
+        (plans_dir / "midline-plan.md").write_text(line * 3, encoding="utf-8")
+
+        result = progress_manager.validate_plan_document("docs/plans/midline-plan.md")
+
+        assert result["valid"] is False
+        assert "tasks" in result["missing_sections"]
+
+    def test_validate_plan_document_ignores_heading_cut_at_chunk_boundary(self, temp_dir):
+        """A heading split by the read boundary must not match as a shorter word."""
+        import doc_generator
+
+        plans_dir = Path("docs/plans")
+        plans_dir.mkdir(parents=True, exist_ok=True)
+        filler = "x" * (doc_generator.PLAN_SCAN_CHUNK_CHARS - len("## Risk") - 1) + "\n"
+        (plans_dir / "cut-plan.md").write_text(
+            filler + "## Risky notes\n- n/a\n## Tasks\n- Task 1\n## Acceptance Mapping\n- ok\n",
+            encoding="utf-8",
+        )
+
+        result = progress_manager.validate_plan_document("docs/plans/cut-plan.md")
+
+        assert result["valid"] is False
+        assert "risks" in result["missing_sections"]
+
+    def test_validate_plan_document_matches_goal_value_after_chunk_boundary(self, temp_dir):
+        """A "**Goal:**" line ending at the read boundary still pairs with its value."""
+        import doc_generator
+
+        plans_dir = Path("docs/plans")
+        plans_dir.mkdir(parents=True, exist_ok=True)
+        filler = "x" * (doc_generator.PLAN_SCAN_CHUNK_CHARS - len("**Goal:**\n") - 1) + "\n"
+        (plans_dir / "goal-plan.md").write_text(
+            filler + "**Goal:**\nShip it\n**Architecture:** CLI\n## Tasks\n- Task 1\n",
+            encoding="utf-8",
+        )
+
+        result = progress_manager.validate_plan_document("docs/plans/goal-plan.md")
+
+        assert result["valid"] is True
+
+    def test_validate_plan_document_matches_heading_split_after_hashes(self, temp_dir):
+        """A "##" line ending at the read boundary still pairs with its title."""
+        import doc_generator
+
+        plans_dir = Path("docs/plans")
+        plans_dir.mkdir(parents=True, exist_ok=True)
+        filler = "x" * (doc_generator.PLAN_SCAN_CHUNK_CHARS - len("##\n") - 1) + "\n"
+        (plans_dir / "hash-plan.md").write_text(
+            filler + "##\nTasks\n- Task 1\n## Acceptance Mapping\n- ok\n## Risks\n- None\n",
+            encoding="utf-8",
+        )
+
+        result = progress_manager.validate_plan_document("docs/plans/hash-plan.md")
+
+        assert result["valid"] is True
+        assert result["missing_sections"] == []
+
 
 class TestJsonErrorHandling:
     """Test JSON parsing error handling."""
@@ -1984,6 +2380,20 @@ class TestJsonErrorHandling:
         captured = capsys.readouterr()
         assert "Error:" in captured.out or "corrupted" in captured.out.lower()
 
+    def test_state_json_codec_stdlib_fallback_format(self, monkeypatch):
+        """Without orjson, state JSON should keep the stdlib indent=2 layout."""
+        import state_io
+
+        monkeypatch.setattr(state_io, "orjson", None)
+        data = {"project_name": "进度", "features": [{"id": 1, "test_steps": []}]}
+
+        text = state_io._dump_json_text(data)
+
+        assert text == json.dumps(data, indent=2, ensure_ascii=False)
+        assert state_io._load_json_bytes(text.encode("utf-8")) == data
+        with pytest.raises(json.JSONDecodeError):
+            state_io._load_json_bytes(b"{broken")
+
 
 class TestMainFunction:
     """Test main function entry point."""
@@ -3077,6 +3487,65 @@ class TestAiMetricsAndCheckpoints:
         assert len(bugs) == 1
         assert bugs[0]["category"] == "technical_debt"
 
+    def test_list_bugs_orders_by_status_then_priority(self, progress_file, capsys):
+        """Open bugs should list before fixed ones, high priority first."""
+        assert progress_manager.add_bug(description="Low open", priority="low") is True
+        assert progress_manager.add_bug(description="Fixed high", priority="high") is True
+        assert progress_manager.add_bug(description="High open", priority="high") is True
+        assert progress_manager.update_bug("BUG-002", status="fixed") is True
+        capsys.readouterr()
+
+        assert progress_manager.list_bugs() is True
+        listed = [line for line in capsys.readouterr().out.splitlines() if line.startswith("- [")]
+        assert listed == [
+            "- [BUG-003] High open",
+            "- [BUG-001] Low open",
+            "- [BUG-002] Fixed high",
+        ]
+
+    def test_remove_bug_drops_bug_and_clears_current(self, progress_file):
+        """Should remove only the matching bug and clear it as current bug."""
+        assert progress_manager.add_bug(description="First bug") is True
+        assert progress_manager.add_bug(description="Second bug") is True
+        data = progress_manager.load_progress_json()
+        data["current_bug_id"] = "BUG-001"
+        progress_manager.save_progress_json(data)
+
+        assert progress_manager.remove_bug("BUG-001") is True
+        assert progress_manager.remove_bug("BUG-404") is False
+
+        data = progress_manager.load_progress_json()
+        assert [bug["id"] for bug in data["bugs"]] == ["BUG-002"]
+        assert data["current_bug_id"] is None
+
+    def test_add_bug_verification_results_depth_limit(self, progress_file):
+        """Should accept 10 levels of nesting and reject the 11th."""
+        def nested(levels):
+            payload = "1"
+            for _ in range(levels):
+                payload = f"[{payload}]"
+            return '{"steps": ' + payload + "}"
+
+        assert progress_manager.add_bug(
+            description="Deep but allowed", verification_results=nested(9)
+        ) is True
+        with pytest.raises(ValueError, match="nesting too deep"):
+            progress_manager._add_bug_internal(
+                description="Too deep", verification_results=nested(10)
+            )
+
+    def test_get_next_bug_id_uses_loaded_data_without_rereading(self, progress_file):
+        """Passing loaded data should skip the progress.json read."""
+        data = {"bugs": [{"id": "BUG-004"}, {"id": "BUG-011"}]}
+        with patch("progress_manager.load_progress_json") as load:
+            assert progress_manager.get_next_bug_id(data) == "BUG-012"
+        load.assert_not_called()
+
+    def test_get_next_bug_id_skips_malformed_ids(self):
+        """Malformed ids should be ignored, and ids past 999 keep counting."""
+        data = {"bugs": [{"id": "BUG-1000"}, {"id": "BUG-x1"}, {"id": "TASK-5000"}, {"id": None}]}
+        assert progress_manager.get_next_bug_id(data) == "BUG-1001"
+
     def test_main_set_feature_ai_metrics_command(self, progress_file):
         """Should handle set-feature-ai-metrics command."""
         with patch(
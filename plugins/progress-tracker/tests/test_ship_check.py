@@ -248,6 +248,27 @@ def test_update_progress_json_writes_ship_check_result(tmp_path, monkeypatch):
     sc = data["features"][0]["quality_gates"]["ship_check"]
     assert sc["status"] == "fail"
     assert sc["failures"][0]["check_id"] == "coverage"
+    assert [p.name for p in state.parent.glob(".progress.json*")] == []
+
+
+def test_update_progress_json_keeps_non_ascii_text_readable(tmp_path):
+    """_update_progress_json writes through state_io, so non-ASCII is not escaped."""
+    from ship_check import _update_progress_json, ShipCheckResult, ShipFailure
+
+    state = tmp_path / "docs" / "progress-tracker" / "state" / "progress.json"
+    state.parent.mkdir(parents=True)
+    state.write_text('{"features": [{"id": 1, "name": "\u767b\u5f55"}]}', encoding="utf-8")
+
+    result = ShipCheckResult(
+        status="fail",
+        failures=[ShipFailure(check_id="docs", detail="缺少文档")],
+        last_run_at="2026-04-28T00:00:00Z",
+    )
+    _update_progress_json(tmp_path, 1, result)
+
+    text = state.read_text(encoding="utf-8")
+    assert "登录" in text
+    assert "缺少文档" in text
 
 
 # ── Task 4: CLI entry point ───────────────────────────────────────────────────